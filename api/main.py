@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -18,6 +19,13 @@ from api.routes import router
 from api.streaming_routes import router as streaming_router
 from src.config.settings import get_settings
 from src.database import close_db, init_db
+from src.tools.database.local_db import close_local_db_client
+from src.tools.place_tool import PlaceSearchTool
+from src.tools.processing.routing import close_routing_client
+from src.tools.search.google_places import (
+    close_google_places_client,
+    warm_google_places_client,
+)
 from src.utils.cache_manager import get_cache_manager
 from src.utils.logger import get_logger
 
@@ -51,6 +59,15 @@ async def lifespan(app: FastAPI):
         else:
             logger.info("⚠️ Redis caching disabled")
 
+        # Pre-warm the Places connection so the first search skips the
+        # TLS handshake; runs in the background, never blocks startup.
+        # Kept on app.state because the event loop only holds a weak
+        # reference to tasks — without a strong ref the warm-up can be
+        # garbage-collected mid-flight.
+        app.state.places_warmup_task = asyncio.create_task(
+            warm_google_places_client()
+        )
+
         logger.info("✅ Auphere Agent ready!")
 
     except Exception as exc:
@@ -72,6 +89,13 @@ async def lifespan(app: FastAPI):
         await cache.disconnect()
         logger.info("✅ Redis cache disconnected")
 
+        # Close shared HTTP clients
+        await close_local_db_client()
+        await close_routing_client()
+        await close_google_places_client()
+        await PlaceSearchTool.aclose()
+        logger.info("✅ HTTP clients closed")
+
     except Exception as exc:
         logger.error(f"❌ Shutdown error: {exc}")
 
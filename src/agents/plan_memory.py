@@ -12,6 +12,7 @@ This file is kept for backward compatibility but should not be used in new code.
 
 from __future__ import annotations
 
+import threading
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
@@ -64,6 +65,8 @@ class PlanMemoryManager:
     """Manages context for plan creation within a session."""
 
     _instances: Dict[str, "PlanMemoryManager"] = {}
+    _instances_lock = threading.Lock()
+    _session_locks: Dict[str, threading.Lock] = {}
     MAX_TURNS: int = 50
     MAX_INSTANCES: int = 200
 
@@ -89,6 +92,45 @@ class PlanMemoryManager:
             cls._instances[session_id] = cls()
         return cls._instances[session_id]
 
+    @classmethod
+    def _lock_for(cls, session_id: str) -> threading.Lock:
+        """Get or create the per-session lock."""
+        lock = cls._session_locks.get(session_id)
+        if lock is None:
+            with cls._instances_lock:
+                lock = cls._session_locks.setdefault(session_id, threading.Lock())
+        return lock
+
+    @classmethod
+    def apply_and_report(
+        cls, session_id: str, updates: Dict[str, Any]
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Apply plan-context updates and report what's still missing, atomically.
+
+        Fuses get_instance + update_plan_context + get_missing_for_plan into
+        one critical section under a per-session lock, so concurrent tool
+        calls for the same session can't interleave between the lookup and
+        the update.
+
+        Args:
+            session_id: Session whose plan context to update
+            updates: Candidate field values; None values are skipped
+
+        Returns:
+            Tuple of (captured field names, still-missing field names)
+        """
+        with cls._lock_for(session_id):
+            instance = cls.get_instance(session_id)
+            captured = [
+                key
+                for key, value in updates.items()
+                if value is not None and hasattr(instance.plan_context, key)
+            ]
+            if captured:
+                instance.update_plan_context(**{key: updates[key] for key in captured})
+            return captured, instance.get_missing_for_plan()
+
     def add_turn(self, user_query: str, agent_response: str):
         """Add conversation turn to memory."""
         self.conversation_history.append(
@@ -154,6 +196,6 @@ class PlanMemoryManager:
     @classmethod
     def clear_session(cls, session_id: str):
         """Clear memory for a given session to prevent leaks."""
-        if session_id in cls._instances:
-            cls._instances.pop(session_id, None)
+        cls._instances.pop(session_id, None)
+        cls._session_locks.pop(session_id, None)
 
@@ -46,6 +46,7 @@ class Settings(BaseSettings):
     redis_key_prefix: str = "auphere:agent"
     places_api_url: str = "http://localhost:8002"
     places_api_timeout: int = 10
+    google_maps_qps: int = 10  # Max concurrent Google Maps requests
     backend_url: str = "http://localhost:8000"
     
     # Cache TTLs (in seconds)
@@ -3,15 +3,54 @@ Translation and i18n support for system messages and UI text.
 Agent responses are handled by multi-language prompts in the LLM.
 """
 
-import json
+import functools
+import string
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional
+
+try:
+    # orjson parses bytes directly and is several times faster than stdlib json
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 from src.config.settings import Settings, get_settings
 from src.utils.cache_manager import CacheManager
 from src.utils.logger import get_logger
 
 
+def _flatten_locale(mapping: dict, prefix: str = "") -> Dict[str, str]:
+    """
+    Flatten nested locale sections into dotted keys.
+
+    Locale files group messages by section ({"error": {"invalid_session":
+    ...}}), while translate() is called with dotted keys
+    ("error.invalid_session"). Flattening once at load time lets lookups
+    and template precompilation both work on plain string keys.
+    """
+    flat: Dict[str, str] = {}
+    for key, value in mapping.items():
+        dotted = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten_locale(value, f"{dotted}."))
+        else:
+            flat[dotted] = value
+    return flat
+
+
+@functools.lru_cache(maxsize=64)
+def _read_locale_file(path_str: str, mtime_ns: int) -> Dict[str, str]:
+    """
+    Read, parse, and flatten a locale JSON file, memoized on (path, mtime).
+
+    Including the file's mtime in the cache key makes the cache
+    self-invalidating: re-instantiating a Translator after a locale file
+    changes on disk parses the new content, while unchanged files skip
+    the read+parse+flatten entirely.
+    """
+    return _flatten_locale(_loads(Path(path_str).read_bytes()))
+
+
 class Translator:
     """
     Handles translation of system messages and UI text.
@@ -34,6 +73,8 @@ class Translator:
         self.cache = cache
         self.logger = get_logger("translator")
         self.locales: Dict[str, Dict[str, str]] = {}
+        # Precompiled format templates: (language, key) -> parsed field list
+        self._templates: Dict[tuple, list] = {}
         self._load_locales()
 
     def _load_locales(self) -> None:
@@ -45,12 +86,17 @@ class Translator:
             return
 
         for lang in self.settings.supported_languages_list:
+            # Key locales on lowercased codes so translate() can look up
+            # without normalizing first
+            lang = lang.lower()
             locale_file = locale_dir / f"{lang}.json"
 
             if locale_file.exists():
                 try:
-                    with open(locale_file, "r", encoding="utf-8") as f:
-                        self.locales[lang] = json.load(f)
+                    self.locales[lang] = _read_locale_file(
+                        str(locale_file), locale_file.stat().st_mtime_ns
+                    )
+                    self._compile_templates(lang)
                     self.logger.info("locale_loaded", language=lang, keys=len(self.locales[lang]))
                 except Exception as exc:
                     self.logger.error("locale_load_error", language=lang, error=str(exc))
@@ -58,6 +104,25 @@ class Translator:
                 self.logger.warning("locale_file_not_found", language=lang, path=str(locale_file))
                 self.locales[lang] = {}
 
+    def _compile_templates(self, lang: str) -> None:
+        """
+        Precompile format templates for locale values with replacement fields.
+
+        str.format re-parses the template syntax on every call; parsing once
+        at load time lets translate() do a direct join over the parsed parts.
+        Values using conversions or format specs keep the str.format path.
+        """
+        for key, value in self.locales[lang].items():
+            if not isinstance(value, str) or "{" not in value:
+                continue
+            try:
+                parsed = list(string.Formatter().parse(value))
+            except ValueError:
+                continue
+            if any(spec or conv for _, field, spec, conv in parsed):
+                continue
+            self._templates[(lang, key)] = parsed
+
     def translate(
         self,
         key: str,
@@ -85,24 +150,30 @@ class Translator:
             ... )
             "Bienvenido, Juan!"
         """
-        # Normalize language
-        language = language.lower()
-
-        # Get locale dictionary
-        locale = self.locales.get(language, {})
-
-        # Get translation
+        # Fast path: locales are keyed on lowercased codes, so try the raw
+        # language first and only normalize on a miss
+        locale = self.locales.get(language)
+        if locale is None:
+            language = language.lower()
+            locale = self.locales.get(language, {})
+
+        # Get translation, tracking which locale provided it for template lookup
         translation = locale.get(key)
+        if translation is not None and not kwargs:
+            return translation
+        source_lang = language
 
         if not translation:
             # Try fallback to default language
             if language != self.settings.default_language:
                 default_locale = self.locales.get(self.settings.default_language, {})
                 translation = default_locale.get(key)
+                source_lang = self.settings.default_language
 
             # Use fallback or key itself
             if not translation:
                 translation = fallback or key
+                source_lang = None
                 self.logger.debug(
                     "translation_missing",
                     key=key,
@@ -111,6 +182,20 @@ class Translator:
 
         # Format with variables if provided
         if kwargs:
+            parts = self._templates.get((source_lang, key)) if source_lang else None
+            if parts is not None:
+                try:
+                    return "".join(
+                        lit + str(kwargs[field]) if field is not None else lit
+                        for lit, field, _, _ in parts
+                    )
+                except KeyError as exc:
+                    self.logger.warning(
+                        "translation_format_error",
+                        key=key,
+                        error=str(exc),
+                    )
+                    return translation
             try:
                 translation = translation.format(**kwargs)
             except KeyError as exc:
@@ -122,6 +207,28 @@ class Translator:
 
         return translation
 
+    def translate_many(self, keys: Iterable[str], language: str) -> List[str]:
+        """
+        Translate a batch of keys in one call.
+
+        Resolves the locale and default-language dicts once and reuses them
+        for every key, instead of paying normalization, attribute lookups,
+        and fallback branching per translate() call. Keys missing from both
+        locales are returned as-is. Format variables are not supported here;
+        use translate() for keys that need them.
+
+        Args:
+            keys: Translation keys to resolve
+            language: Target language code
+
+        Returns:
+            Translated strings, in input order
+        """
+        language = language.lower()
+        locale = self.locales.get(language, {})
+        default = self.locales.get(self.settings.default_language, {})
+        return [locale.get(k) or default.get(k) or k for k in keys]
+
     def t(self, key: str, language: str, **kwargs) -> str:
         """Shorthand alias for translate()."""
         return self.translate(key, language, **kwargs)
@@ -167,8 +274,10 @@ class Translator:
         return self.translate(key, language, **kwargs)
 
 
-# Global translator instance
-_translator_instance: Optional[Translator] = None
+@functools.lru_cache(maxsize=1)
+def _default_translator() -> Translator:
+    """Build the process-wide default Translator (thread-safe via lru_cache)."""
+    return Translator()
 
 
 def get_translator(
@@ -178,15 +287,22 @@ def get_translator(
     """
     Get or create global translator instance.
 
+    The default (no-args) path is memoized with functools.lru_cache, which
+    is thread-safe — concurrent first calls under a threadpool executor
+    construct at most one Translator. Tests can reset it with
+    _default_translator.cache_clear(). Passing the get_settings()
+    singleton (as the FastAPI dependency does on every request) also
+    resolves to the shared instance — only a genuinely custom settings
+    object or cache gets a dedicated Translator.
+
     Args:
         settings: Optional settings instance
         cache: Optional cache manager
 
     Returns:
-        Singleton Translator instance
+        Shared Translator instance (or a dedicated one for custom args)
     """
-    global _translator_instance
-    if _translator_instance is None:
-        _translator_instance = Translator(settings, cache)
-    return _translator_instance
+    if cache is None and (settings is None or settings is get_settings()):
+        return _default_translator()
+    return Translator(settings, cache)
 
@@ -7,6 +7,27 @@ from src.config.models_config import MODEL_PROFILES, ModelProfile
 from src.config.settings import Settings, get_settings
 from src.utils.logger import get_logger
 
+# Routing table: (intention, complexity) -> model key. Pairs not listed
+# fall back to _DEFAULT_MODEL_KEY. Validated at import so route() needs no
+# per-call membership check against MODEL_PROFILES.
+_DEFAULT_MODEL_KEY = "gpt-4o-mini"
+
+_ROUTE_TABLE: dict[tuple[IntentType, str], str] = {
+    # Plans benefit from better reasoning (routing, scoring, itinerary)
+    (IntentType.PLAN, "high"): "gpt-4",
+    (IntentType.PLAN, "medium"): "gpt-4-turbo",
+    # Recommendations benefit from scoring tool + good reasoning
+    (IntentType.RECOMMEND, "high"): "gpt-4-turbo",
+    (IntentType.RECOMMEND, "medium"): "gpt-4-turbo",
+    # Simple conversation, use cheapest model
+    (IntentType.CHITCHAT, "low"): "gpt-3.5-turbo",
+    (IntentType.CHITCHAT, "medium"): "gpt-3.5-turbo",
+    (IntentType.CHITCHAT, "high"): "gpt-3.5-turbo",
+}
+
+assert all(key in MODEL_PROFILES for key in _ROUTE_TABLE.values())
+assert _DEFAULT_MODEL_KEY in MODEL_PROFILES
+
 
 class LLMRouter:
     """Decides which LLM to use based on intent, complexity, and budget."""
@@ -42,40 +63,10 @@ class LLMRouter:
         intention = classification.intention
         complexity = classification.complexity
 
-        # 2. Enhanced Routing Logic
-        selected_model_key = "gpt-4o-mini"  # Default
-
-        if intention == IntentType.PLAN:
-            # Plans benefit from better reasoning (routing, scoring, itinerary)
-            if complexity == "high":
-                selected_model_key = "gpt-4"  # Best reasoning for complex plans
-            elif complexity == "medium":
-                selected_model_key = "gpt-4-turbo"  # Good balance
-            else:
-                selected_model_key = "gpt-4o-mini"  # Simple plans
-        
-        elif intention == IntentType.RECOMMEND:
-            # Recommendations benefit from scoring tool + good reasoning
-            if complexity == "high":
-                selected_model_key = "gpt-4-turbo"  # Complex scoring/ranking
-            elif complexity == "medium":
-                selected_model_key = "gpt-4-turbo"  # Benefit from better reasoning
-            else:
-                selected_model_key = "gpt-4o-mini"  # Simple recommendations
-
-        elif intention == IntentType.SEARCH:
-            # Search is mostly tool-driven (google_places_tool, web_search_tool)
-            # Less reasoning needed, prefer faster/cheaper model
-            selected_model_key = "gpt-4o-mini"
-            
-        elif intention == IntentType.CHITCHAT:
-            # Simple conversation, use cheapest model
-            selected_model_key = "gpt-3.5-turbo"
-
-        # 3. Fallback validation
-        if selected_model_key not in MODEL_PROFILES:
-            self.logger.warning("router-model-not-found", model=selected_model_key)
-            selected_model_key = "gpt-4o-mini"
+        # 2. Table-driven routing: one hash lookup instead of the old
+        # if/elif chain; the table is validated against MODEL_PROFILES at
+        # import time so no per-call membership check is needed
+        selected_model_key = _ROUTE_TABLE.get((intention, complexity), _DEFAULT_MODEL_KEY)
 
         profile = MODEL_PROFILES[selected_model_key]
         
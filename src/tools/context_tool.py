@@ -12,7 +12,7 @@ This file kept for backward compatibility but should not be used.
 """
 from typing import List, Optional
 
-from langchain_core.tools import tool
+from src.utils.tool_cache import tool
 
 
 @tool
@@ -11,6 +11,13 @@ Use database tools for:
 - Cached data
 """
 
+from src.utils.logger import get_logger
+
+# Single shared logger for all database tools: one structlog configuration
+# at boot instead of one per submodule. Must be defined before the
+# submodule imports below so they can do `from . import logger`.
+logger = get_logger("database_tools")
+
 from .local_db import search_local_db_fallback_tool
 from .metrics import get_local_metrics_tool
 from .preferences import get_user_preferences_tool
@@ -18,16 +18,59 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 
 import httpx
-from langchain_core.tools import tool
-from pydantic import BaseModel, Field
+from src.utils.tool_cache import tool
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.config.settings import Settings, get_settings
-from src.utils.logger import get_logger
+from . import logger
 
-logger = get_logger("local_db_fallback_tool")
 
+class LocalDbQuery(BaseModel):
+    """Arguments for search_local_db_fallback_tool.
 
-@tool
+    Declared explicitly (instead of letting LangChain synthesize a schema
+    from the signature) so pydantic_core validates all eight fields in a
+    single Rust-side pass, with unknown keys rejected outright.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    query: str = Field(description="Search query (e.g., 'italian restaurant', 'tapas')")
+    city: str = Field("Zaragoza", description="City to search in (currently only 'Zaragoza' supported)")
+    place_type: Optional[str] = Field(None, description="Specific place type (bar, restaurant, cafe, museum, park)")
+    min_rating: Optional[float] = Field(None, ge=0, le=5, description="Minimum rating (0-5)")
+    max_results: int = Field(20, description="Maximum number of results")
+    lat: Optional[float] = Field(None, description="Latitude for proximity search")
+    lon: Optional[float] = Field(None, description="Longitude for proximity search")
+    radius_km: Optional[float] = Field(None, description="Search radius in kilometers (if lat/lon provided)")
+
+# Shared AsyncClient so repeated fallback calls reuse pooled keep-alive
+# connections to the Rust microservice instead of paying TCP/TLS setup per
+# call. Created lazily because get_settings() can't run at import time.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client(settings: Settings) -> httpx.AsyncClient:
+    """Get or lazily create the shared HTTP client for the places service."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=settings.places_api_url,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=5.0,
+        )
+    return _client
+
+
+async def close_local_db_client() -> None:
+    """Close the shared HTTP client (called from the app shutdown hook)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@tool(args_schema=LocalDbQuery)
 async def search_local_db_fallback_tool(
     query: str,
     city: str = "Zaragoza",
@@ -71,23 +114,39 @@ async def search_local_db_fallback_tool(
     settings = get_settings()
     
     try:
-        logger.info(f"Local DB fallback search: {query} in {city}")
-        logger.warning("Using local DB fallback - consider using google_places_tool for real-time data")
-        
-        # TODO: Call the auphere-places Rust microservice /places/search endpoint
-        # This should use PLACES_API_URL from settings
-        
+        logger.info("local_db_fallback_search", query=query, city=city)
+        logger.warning("local_db_fallback_used", hint="prefer google_places_tool for real-time data")
+
+        # Same wire format as PlaceSearchTool._do_search: the Rust API
+        # expects q/type and wraps results in a "data" field
+        params: Dict[str, Any] = {"q": query, "city": city, "limit": max_results}
+        if place_type:
+            params["type"] = place_type
+        if min_rating is not None:
+            params["min_rating"] = min_rating
+        if lat is not None and lon is not None:
+            params["lat"] = lat
+            params["lon"] = lon
+            if radius_km is not None:
+                params["radius_km"] = radius_km
+
+        client = _get_client(settings)
+        response = await client.get("/places/search", params=params)
+        response.raise_for_status()
+        data = response.json()
+
+        results = data.get("data") or []
         return {
             "query": query,
             "city": city,
-            "results": [],
-            "total_results": 0,
+            "results": results,
+            "total_results": len(results),
             "source": "local_cache",
             "message": "Local DB fallback tool - queries cached data. Use google_places_tool for real-time data.",
         }
         
     except Exception as e:
-        logger.error(f"Error in local DB fallback search: {str(e)}")
+        logger.error("local_db_fallback_error", error=str(e))
         return {
             "error": True,
             "message": f"Could not search local database: {str(e)}",
@@ -6,11 +6,9 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
-from langchain_core.tools import tool
+from src.utils.tool_cache import tool
 
-from src.utils.logger import get_logger
-
-logger = get_logger("metrics_tool")
+from . import logger
 
 
 @tool
@@ -31,7 +29,7 @@ async def get_local_metrics_tool(
         Metrics and analytics data
     """
     try:
-        logger.info(f"Getting metrics for place {place_id}, type: {metric_type}")
+        logger.info("local_metrics_lookup", place_id=place_id, metric_type=metric_type)
         
         return {
             "place_id": place_id,
@@ -41,6 +39,6 @@ async def get_local_metrics_tool(
         }
         
     except Exception as e:
-        logger.error(f"Error getting metrics: {str(e)}")
+        logger.error("local_metrics_error", error=str(e))
         return {"error": True, "message": f"Could not get metrics: {str(e)}"}
 
@@ -6,11 +6,9 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
-from langchain_core.tools import tool
+from src.utils.tool_cache import tool
 
-from src.utils.logger import get_logger
-
-logger = get_logger("preferences_tool")
+from . import logger
 
 
 @tool
@@ -29,7 +27,7 @@ async def get_user_preferences_tool(
         User preferences data
     """
     try:
-        logger.info(f"Getting preferences for user {user_id}")
+        logger.info("user_preferences_lookup", user_id=user_id)
         
         return {
             "user_id": user_id,
@@ -38,6 +36,6 @@ async def get_user_preferences_tool(
         }
         
     except Exception as e:
-        logger.error(f"Error getting preferences: {str(e)}")
+        logger.error("user_preferences_error", error=str(e))
         return {"error": True, "message": f"Could not get preferences: {str(e)}"}
 
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
-from langchain_core.tools import tool
+from src.utils.tool_cache import tool
 from pydantic import BaseModel, Field
 
 from src.utils.logger import get_logger
@@ -70,14 +70,23 @@ async def generate_plan_json_tool(
         logger.info(f"Generating plan JSON: {title}")
         
         plan_id = str(uuid4())
-        
+
+        # Collect zones and the rating sum in a single pass over stops
+        zones = set()
+        rating_sum = 0.0
+        for stop in stops:
+            zone = (stop.get("location") or {}).get("zone")
+            if zone:
+                zones.add(zone)
+            rating_sum += stop.get("rating", 0)
+
         # Build execution metadata
         execution = {
             "date": date,
             "startTime": start_time,
             "durationHours": total_duration_hours,
             "city": city,
-            "zones": list(set(stop.get("location", {}).get("zone", "") for stop in stops if stop.get("location", {}).get("zone"))),
+            "zones": list(zones),
             "groupSize": group_size,
             "groupComposition": "couple" if group_size == 2 and "romantic" in vibes else "friends"
         }
@@ -95,7 +104,7 @@ async def generate_plan_json_tool(
             },
             "metrics": {
                 "vibeMatchPercent": 95,
-                "averageVenueRating": sum(stop.get("rating", 0) for stop in stops) / len(stops) if stops else 0,
+                "averageVenueRating": rating_sum / len(stops) if stops else 0,
                 "successProbabilityLabel": "High"
             }
         }
@@ -2,11 +2,35 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 import httpx
 from langchain_core.tools import tool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter, model_validator
+
+try:
+    # C-level parse; httpx's response.json() goes through pure-Python json
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    from async_lru import alru_cache
+except ImportError:
+    alru_cache = None
+
+
+def _ttl_cache(func):
+    """Apply a short async TTL cache when async-lru is installed."""
+    if alru_cache is None:
+        return func
+    return alru_cache(maxsize=512, ttl=60)(func)
 
 from src.config.settings import Settings, get_settings
 from src.utils.logger import get_logger
@@ -16,7 +40,7 @@ from src.utils.logger import get_logger
 # TERM MAPPING: Spanish terms → English API terms
 # This mapping is used to translate user queries to API-compatible terms
 # ============================================================
-TERM_MAPPING: Dict[str, str] = {
+_TERM_MAPPING_RAW: Dict[str, str] = {
     # Bares
     "bares": "bar",
     "bar": "bar",
@@ -87,8 +111,15 @@ TERM_MAPPING: Dict[str, str] = {
     "dormir": "lodging",
 }
 
+# Frozen with interned keys: read-only views prevent accidental mutation of
+# the module constants, and interned strings let dict lookups short-circuit
+# on pointer identity before falling back to a full compare.
+TERM_MAPPING: Mapping[str, str] = MappingProxyType(
+    {sys.intern(k): sys.intern(v) for k, v in _TERM_MAPPING_RAW.items()}
+)
+
 # Reverse mapping for display (API term → Spanish display name)
-TYPE_DISPLAY_NAMES: Dict[str, str] = {
+_TYPE_DISPLAY_NAMES_RAW: Dict[str, str] = {
     "bar": "bar",
     "restaurant": "restaurante",
     "cafe": "cafetería",
@@ -100,36 +131,97 @@ TYPE_DISPLAY_NAMES: Dict[str, str] = {
     "other": "lugar",
 }
 
+TYPE_DISPLAY_NAMES: Mapping[str, str] = MappingProxyType(
+    {sys.intern(k): sys.intern(v) for k, v in _TYPE_DISPLAY_NAMES_RAW.items()}
+)
+
+
+# Aho-Corasick automaton over TERM_MAPPING keys: one linear scan of the
+# query instead of ~60 per-key substring tests. Optional dependency; the
+# plain loop below remains as fallback.
+try:
+    import ahocorasick
+
+    _TERM_AUTOMATON = ahocorasick.Automaton()
+    for _term, _api_term in TERM_MAPPING.items():
+        _TERM_AUTOMATON.add_word(_term, (_term, _api_term))
+    _TERM_AUTOMATON.make_automaton()
+except ImportError:
+    _TERM_AUTOMATON = None
 
+# Fallback scanner: one compiled alternation over all keys, longest first
+# so multi-word terms like "centro comercial" win over tokens they contain.
+# A single C-level re.search replaces the per-key Python substring loop.
+_TERM_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, sorted(TERM_MAPPING, key=len, reverse=True))) + r")\b"
+)
+
+
+def _is_word_char(ch: str) -> bool:
+    """Mirror of re's \\w, for the automaton's word-boundary post-filter."""
+    return ch.isalnum() or ch == "_"
+
+
+@lru_cache(maxsize=2048)
 def normalize_query(query: str) -> tuple[str, Optional[str]]:
     """
     Normalize a Spanish query to English API term without losing modifiers.
-    
+
+    Pure function memoized with lru_cache: user queries repeat heavily
+    ("bar", "restaurante", ...), so repeats cost one dict lookup instead
+    of the keyword scan. Tests can reset via normalize_query.cache_clear().
+
     Args:
         query: User query in Spanish or English
-        
+
     Returns:
         Tuple of (search_query, place_type) where place_type is for filtering.
         The search_query preserves adjectives like "asiática", "italiana", etc.
     """
     query_clean = query.strip()
-    query_lower = query_clean.lower()
-    
+    # Skip the .lower() allocation when the query is already lowercase ASCII
+    # (the common case for agent-issued terms like "bar", "restaurant")
+    if query_clean.isascii() and query_clean.islower():
+        query_lower = query_clean
+    else:
+        query_lower = query_clean.lower()
+    if len(query_lower) < 32:
+        # Short queries are likely dictionary terms; interning makes the
+        # lookups below identity-compare against the interned keys
+        query_lower = sys.intern(query_lower)
+
     # Check exact match first (e.g., "bares", "bar")
     if query_lower in TERM_MAPPING:
         api_term = TERM_MAPPING[query_lower]
         return api_term, api_term
-    
+
     # If query contains a known keyword, keep the original query for the search
     # but still return the detected place type for filtering.
-    for spanish_term, api_term in TERM_MAPPING.items():
-        if spanish_term in query_lower:
+    if _TERM_AUTOMATON is not None:
+        for end_index, (term, api_term) in _TERM_AUTOMATON.iter(query_lower):
+            # The automaton matches raw substrings; keep only whole-word
+            # hits so this path agrees with the \b boundaries in _TERM_RE
+            # ("barato" must not count as "bar")
+            start = end_index - len(term) + 1
+            if start > 0 and _is_word_char(query_lower[start - 1]):
+                continue
+            if end_index + 1 < len(query_lower) and _is_word_char(query_lower[end_index + 1]):
+                continue
             return query_clean, api_term
-    
+        return query_clean, None
+
+    match = _TERM_RE.search(query_lower)
+    if match:
+        return query_clean, TERM_MAPPING[match.group(1)]
+
     # No match found, return original
     return query_clean, None
 
 
+# Word tokens of a place type: splits "wine_bar", "cafe-bar", "coffee shop"
+_TYPE_TOKEN_RE = re.compile(r"[^\W\d_]+", re.UNICODE)
+
+
 class PlaceResult(BaseModel):
     """Structured result for a place from Rust API."""
 
@@ -150,6 +242,22 @@ class PlaceResult(BaseModel):
     is_subscribed: Optional[bool] = Field(default=False, description="Subscription status")
     created_at: Optional[str] = Field(default=None, description="Creation timestamp")
     
+    # Coordinates unpacked once at validation instead of per property access
+    _lat: float = PrivateAttr(default=0.0)
+    _lon: float = PrivateAttr(default=0.0)
+    # Lowercased word tokens of `type`, computed on first use
+    _type_tokens: Optional[frozenset] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _cache_coordinates(self) -> "PlaceResult":
+        """Unpack the [longitude, latitude] array once per instance."""
+        location = self.location
+        if location:
+            self._lon = location[0]
+            if len(location) > 1:
+                self._lat = location[1]
+        return self
+
     # Helper properties for backward compatibility
     @property
     def address(self) -> str:
@@ -158,28 +266,92 @@ class PlaceResult(BaseModel):
         if self.district:
             parts.insert(1, self.district)
         return ", ".join(parts)
-    
+
     @property
     def latitude(self) -> float:
-        """Extract latitude from location array."""
-        return self.location[1] if len(self.location) > 1 else 0.0
-    
+        """Latitude, precomputed from the location array at validation."""
+        return self._lat
+
     @property
     def longitude(self) -> float:
-        """Extract longitude from location array."""
-        return self.location[0] if len(self.location) > 0 else 0.0
-    
+        """Longitude, precomputed from the location array at validation."""
+        return self._lon
+
+    @property
+    def type_tokens(self) -> frozenset:
+        """Lowercased word tokens of the place type, tokenized once.
+
+        "wine_bar" and "cocktail-bar" both yield {"bar", ...}, so consumers
+        can do O(1) set membership instead of repeated substring scans.
+        """
+        tokens = self._type_tokens
+        if tokens is None:
+            tokens = (
+                frozenset(_TYPE_TOKEN_RE.findall(self.type.lower()))
+                if self.type
+                else frozenset()
+            )
+            self._type_tokens = tokens
+        return tokens
+
     model_config = {"extra": "ignore"}  # Ignore extra fields from API
 
 
+# Precompiled list validator: one fused pydantic-core pass over the whole
+# response instead of N Python-level PlaceResult(**d) constructor calls.
+_PLACES_ADAPTER = TypeAdapter(List[PlaceResult])
+
+# Declared field names, for trimming unknown keys before validation. The
+# Rust API ships fields we never model; dropping them with one set
+# intersection per place is cheaper than extra="ignore" walking every key
+# through pydantic's general-purpose extra handling.
+_ALLOWED_FIELDS = frozenset(PlaceResult.model_fields)
+
+
 class PlaceSearchTool:
     """Tool for searching places via the Rust Places API."""
 
+    # Shared client so all searches reuse pooled keep-alive connections
+    # instead of paying TCP/TLS setup per call. Lazily created because
+    # settings aren't available at import time.
+    _client: Optional[httpx.AsyncClient] = None
+
+    # In-flight request coalescing: concurrent searches with identical
+    # parameters share one task instead of each hitting the Rust API.
+    # Safe without a lock — mutations happen on the single event loop.
+    _inflight: Dict[tuple, "asyncio.Task[List[PlaceResult]]"] = {}
+
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings or get_settings()
-        self.logger = get_logger("place-tool", settings=self.settings)
         self.base_url = self.settings.places_api_url
         self.timeout = self.settings.places_api_timeout
+        # Bind the static context once instead of passing it per call
+        self.logger = get_logger("place-tool", settings=self.settings).bind(
+            base_url=self.base_url
+        )
+        # Level gate evaluated once; structlog's default PrintLogger has no
+        # isEnabledFor, so mirror the stdlib level configured at boot to
+        # skip kwargs-dict construction for filtered info events.
+        self._info_enabled = logging.getLogger("place-tool").isEnabledFor(logging.INFO)
+
+    @classmethod
+    def _get_client(cls, timeout: float) -> httpx.AsyncClient:
+        """Get or lazily create the shared HTTP client."""
+        if cls._client is None:
+            cls._client = httpx.AsyncClient(
+                timeout=timeout,
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                headers={"accept-encoding": "gzip, br"},
+            )
+        return cls._client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the shared HTTP client (called from the app shutdown hook)."""
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
 
     async def search_places(
         self,
@@ -208,64 +380,122 @@ class PlaceSearchTool:
         """
         # Normalize query (translate Spanish → English API terms)
         normalized_query, detected_type = normalize_query(query)
-        
+
         # Use detected type if no explicit type provided
         if place_type is None:
             place_type = detected_type
-        
-        limit = max_results  # Alias for compatibility
-        params = {
-            "q": normalized_query,
-            "city": city,
-            "limit": limit,
-        }
-        
-        # Add type filter if we have one (improves search accuracy)
-        if place_type:
-            params["type"] = place_type
-        
-        if lat is not None and lon is not None:
-            params["lat"] = lat
-            params["lon"] = lon
-            params["radius_km"] = radius_km
-
-        self.logger.info(
-            "searching-places",
-            query=query,
-            normalized_query=normalized_query,
-            place_type=place_type,
-            city=city,
-            has_location=bool(lat and lon),
+
+        # Coalesce duplicate concurrent requests onto one in-flight task
+        key = (normalized_query, city, place_type, lat, lon, radius_km, max_results)
+        task = self._inflight.get(key)
+        if task is not None:
+            return await task
+
+        task = asyncio.ensure_future(
+            self._do_search(
+                query, normalized_query, city, lat, lon, radius_km, max_results, place_type
+            )
         )
+        self._inflight[key] = task
+        try:
+            return await task
+        finally:
+            self._inflight.pop(key, None)
 
+    async def search_places_raw(
+        self,
+        query: str,
+        city: str = "Zaragoza",
+        lat: Optional[float] = None,
+        lon: Optional[float] = None,
+        radius_km: int = 5,
+        max_results: int = 5,
+        place_type: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for places, returning the raw API dicts without model parsing.
+
+        Fast path for callers that only read a few fields (e.g. the
+        LangChain text formatter): skips PlaceResult construction and the
+        round-trip through Pydantic entirely.
+        """
+        normalized_query, detected_type = normalize_query(query)
+        if place_type is None:
+            place_type = detected_type
+        return await self._fetch_raw(
+            query, normalized_query, city, lat, lon, radius_km, max_results, place_type
+        )
+
+    async def _do_search(
+        self,
+        query: str,
+        normalized_query: str,
+        city: str,
+        lat: Optional[float],
+        lon: Optional[float],
+        radius_km: int,
+        max_results: int,
+        place_type: Optional[str],
+    ) -> List[PlaceResult]:
+        """Fetch raw place dicts and validate them into PlaceResult models."""
+        places_data = await self._fetch_raw(
+            query, normalized_query, city, lat, lon, radius_km, max_results, place_type
+        )
+
+        # Trim keys we don't model before handing the batch to pydantic.
+        # Guard the shape first: upstream may send {"data": null} (making
+        # places_data None) or non-dict entries, neither of which should
+        # blow up outside _fetch_raw's error handling.
+        places_data = [
+            {k: place_dict[k] for k in place_dict.keys() & _ALLOWED_FIELDS}
+            for place_dict in places_data or []
+            if isinstance(place_dict, dict)
+        ]
+
+        # Convert to PlaceResult objects: validate the whole list in one
+        # pydantic-core pass, dropping to per-item parsing only when some
+        # entry is malformed so the rest can still be kept.
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/places/search",
-                    params=params,
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                # Rust API returns "data" field
-                places_data = data.get("data", [])
-                
-                # Convert to PlaceResult objects
-                places = []
-                for place_dict in places_data:
-                    try:
-                        places.append(PlaceResult(**place_dict))
-                    except Exception as parse_error:
-                        self.logger.warning(
-                            "failed-to-parse-place",
-                            place_name=place_dict.get("name", "unknown"),
-                            error=str(parse_error),
-                        )
-                        continue
-                
-                self.logger.info("places-found", count=len(places))
-                return places
+            places = _PLACES_ADAPTER.validate_python(places_data)
+        except Exception:
+            places = []
+            for place_dict in places_data:
+                try:
+                    places.append(PlaceResult(**place_dict))
+                except Exception as parse_error:
+                    self.logger.warning(
+                        "failed-to-parse-place",
+                        place_name=place_dict.get("name", "unknown"),
+                        error=str(parse_error),
+                    )
+                    continue
+
+        if self._info_enabled:
+            self.logger.info("places-found", count=len(places))
+        return places
+
+    async def _fetch_raw(
+        self,
+        query: str,
+        normalized_query: str,
+        city: str,
+        lat: Optional[float],
+        lon: Optional[float],
+        radius_km: int,
+        max_results: int,
+        place_type: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch raw place dicts, degrading to an empty list on failure.
 
+        Error handling lives out here, outside the TTL cache, so a
+        transient upstream failure is never cached — alru_cache discards
+        entries whose task raised, and the next call retries the request.
+        """
+        try:
+            return await self._fetch_raw_cached(
+                query, normalized_query, city, lat, lon, radius_km, max_results, place_type
+            )
         except httpx.HTTPStatusError as exc:
             self.logger.error(
                 "places-api-http-error",
@@ -280,6 +510,80 @@ class PlaceSearchTool:
             self.logger.error("places-search-failed", error=str(exc), exc_info=True)
             return []
 
+    @_ttl_cache
+    async def _fetch_raw_cached(
+        self,
+        query: str,
+        normalized_query: str,
+        city: str,
+        lat: Optional[float],
+        lon: Optional[float],
+        radius_km: int,
+        max_results: int,
+        place_type: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Perform the actual API request and return the raw place dicts.
+
+        Results are served from a 60-second TTL cache when async-lru is
+        installed; Places data is stable on that timescale, and repeated
+        agent queries skip the HTTP round-trip entirely. Failures raise
+        (and are caught in _fetch_raw) so they never occupy a cache slot.
+        """
+        # One dict literal instead of a base dict plus per-branch inserts;
+        # the type filter improves search accuracy when present
+        params = {
+            "q": normalized_query,
+            "city": city,
+            "limit": max_results,
+            **({"type": place_type} if place_type else {}),
+            **(
+                {"lat": lat, "lon": lon, "radius_km": radius_km}
+                if lat is not None and lon is not None
+                else {}
+            ),
+        }
+
+        if self._info_enabled:
+            self.logger.info(
+                "searching-places",
+                query=query,
+                normalized_query=normalized_query,
+                place_type=place_type,
+                city=city,
+                has_location=bool(lat and lon),
+            )
+
+        client = self._get_client(self.timeout)
+        response = await client.get(
+            f"{self.base_url}/places/search",
+            params=params,
+        )
+        response.raise_for_status()
+        data = _json_loads(response.content)
+
+        # Rust API returns "data" field; it can be null, and its rows can
+        # contain null/non-dict junk. Normalize here so every consumer of
+        # the raw path (search_places_raw included) sees a list of dicts.
+        places = data.get("data") or []
+        return [place for place in places if isinstance(place, dict)]
+
+
+# BETA: cities the Places database actually covers (plus common misspellings)
+_ALLOWED_CITIES: frozenset[str] = frozenset({"zaragoza", "zaragosa", "saragossa"})
+
+# Shared instance for the LangChain wrapper: avoids re-running
+# get_settings() and logger setup on every tool invocation.
+_TOOL_SINGLETON: Optional[PlaceSearchTool] = None
+
+
+def _get_tool() -> PlaceSearchTool:
+    """Get or lazily create the shared PlaceSearchTool instance."""
+    global _TOOL_SINGLETON
+    if _TOOL_SINGLETON is None:
+        _TOOL_SINGLETON = PlaceSearchTool()
+    return _TOOL_SINGLETON
+
 
 # LangChain tool wrapper for use in agents
 @tool
@@ -314,39 +618,46 @@ async def search_places_tool(
         search_places_tool("restaurant", "Zaragoza", 10)
     """
     # BETA: Enforce Zaragoza only
-    if city.lower() not in ["zaragoza", "zaragosa", "saragossa"]:
+    city_lower = city.lower()
+    if city_lower not in _ALLOWED_CITIES:
         return f"⚠️ Por el momento solo tenemos información de lugares en Zaragoza. No puedo buscar en '{city}' todavía. ¿Te gustaría buscar '{query}' en Zaragoza?"
     
     # Force city to be Zaragoza
     city = "Zaragoza"
     
-    # Create tool instance and search (normalization happens inside search_places)
-    tool_instance = PlaceSearchTool()
-    places = await tool_instance.search_places(query=query, city=city, max_results=limit)
+    # Shared tool instance; normalization happens inside the search. The raw
+    # path skips PlaceResult construction — this formatter only reads a few
+    # fields before rendering text for the LLM.
+    places = await _get_tool().search_places_raw(query=query, city=city, max_results=limit)
     
     if not places:
         # Provide helpful suggestions based on known types
         suggestions = "bar, restaurant, cafe, museum, park, lodging"
         return f"No se encontraron lugares para '{query}' en {city}. Intenta buscar por tipo: {suggestions}"
     
-    # Format results as readable text for the LLM
+    # Format results as readable text for the LLM. Bind the lookups once so
+    # the loop uses fast locals instead of global+attribute loads.
     result_lines = [f"Encontré {len(places)} lugares en {city}:"]
+    _display = TYPE_DISPLAY_NAMES.get
+    _append = result_lines.append
     for idx, place in enumerate(places, 1):
-        name = place.name
-        rating = place.google_rating
+        name = place.get("name", "")
+        rating = place.get("google_rating")
+        place_type = place.get("type")
+        rating_count = place.get("google_rating_count")
         # Get Spanish display name for type
-        place_type_display = TYPE_DISPLAY_NAMES.get(place.type, place.type or "lugar")
-        
-        line = f"{idx}. {name}"
+        place_type_display = _display(place_type, place_type or "lugar")
+
+        parts = [f"{idx}. {name}"]
         if place_type_display:
-            line += f" ({place_type_display})"
+            parts.append(f" ({place_type_display})")
         if rating:
-            line += f" - ⭐ {rating}/5"
-        if place.google_rating_count:
-            line += f" ({place.google_rating_count} reseñas)"
-        
-        result_lines.append(line)
-    
+            parts.append(f" - ⭐ {rating}/5")
+        if rating_count:
+            parts.append(f" ({rating_count} reseñas)")
+
+        _append("".join(parts))
+
     return "\n".join(result_lines)
 
 
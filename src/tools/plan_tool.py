@@ -5,16 +5,110 @@ Optimizes routes and provides time estimates with better data extraction.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import re
+from datetime import datetime
+from functools import lru_cache
+from math import asin, cos, radians, sin, sqrt
 from typing import Any, Dict, List, Optional
 
 import httpx
+import numpy as np
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:  # pragma: no cover - orjson is in requirements
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
 from src.config.settings import Settings, get_settings
 from src.tools.place_tool import PlaceResult, PlaceTool
 from src.utils.logger import get_logger
 
+_EARTH_RADIUS_KM = 6371
+
+# Duration phrases -> minutes, compiled once into a single alternation so
+# _parse_duration does one C-level scan instead of 20 Python substring
+# checks. Keys sorted longest-first so "full day" wins over "day".
+_DURATION_MAP: Dict[str, int] = {
+    "quick": 30,
+    "rápido": 30,
+    "30 min": 30,
+    "1 hour": 60,
+    "una hora": 60,
+    "1h": 60,
+    "2 hours": 120,
+    "dos horas": 120,
+    "2h": 120,
+    "afternoon": 180,
+    "tarde": 180,
+    "evening": 240,
+    "noche": 240,
+    "full_day": 480,
+    "todo el día": 480,
+    "full day": 480,
+    "un día": 480,
+    "un dia": 480,
+    "1 día": 480,
+    "1 dia": 480,
+    "ida y vuelta": 480,
+    "day trip": 480,
+}
+_DURATION_RE = re.compile(
+    "|".join(map(re.escape, sorted(_DURATION_MAP, key=len, reverse=True))),
+    re.IGNORECASE,
+)
+
+# Static plan copy, hoisted so the per-plan helpers don't rebuild dict
+# literals on every call
+_VIBE_ACTIVITIES: Dict[str, str] = {
+    "romantic": "Enjoy a romantic moment together",
+    "party": "Have fun and enjoy the atmosphere",
+    "adventure": "Explore and discover something new",
+    "chill": "Relax and unwind",
+}
+
+_PERSONALIZATION_NOTES: Dict[str, str] = {
+    "romantic": "👫 Reserva con anticipación, estas son buenas opciones para parejas",
+    "party": "🎉 ¡A divertirse! Estos son los mejores lugares para un buen ambiente",
+    "adventure": "🚀 Prepárate para explorar lugares únicos y emocionantes",
+    "chill": "☕ Perfectos para relajarse y desconectar",
+}
+
+_COST_MAP: Dict[str, str] = {
+    "high": "$$$",
+    "medium": "$$",
+    "low": "$",
+}
+
+# Place-type token -> suggested activity, checked in priority order against
+# the tokenized place type (one hash lookup per entry instead of substring
+# scans per step)
+_ACTIVITY_BY_TYPE: Dict[str, str] = {
+    "bar": "Enjoy drinks and ambiance",
+    "restaurant": "Have a meal and relax",
+    "museum": "Explore exhibits",
+    "park": "Take a leisurely walk",
+    "cafe": "Grab a coffee and snack",
+    "coffee": "Grab a coffee and snack",
+}
+
+
+def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Haversine distance in km between two points, scalar hot path."""
+    lat1, lon1, lat2, lon2 = radians(lat1), radians(lon1), radians(lat2), radians(lon2)
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
+    return _EARTH_RADIUS_KM * 2 * asin(sqrt(a))
+
 
 class TimeSlot(BaseModel):
     """Time slot for a plan step."""
@@ -70,6 +164,26 @@ class Itinerary(BaseModel):
         default_factory=dict, description="Additional metadata"
     )
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize the itinerary to UTF-8 JSON bytes.
+
+        orjson encodes the nested step list noticeably faster than
+        model_dump_json; response handlers that need raw JSON should
+        prefer this over re-encoding model_dump() with stdlib json.
+        """
+        return _json_dumps(self.model_dump())
+
+
+@lru_cache(maxsize=1)
+def _shared_place_tool() -> PlaceTool:
+    """Shared PlaceTool for PlanTool instances built on default settings.
+
+    PlanTool is constructed per request in the tool layer; reusing one
+    PlaceTool keeps those constructions cheap and lets every plan share
+    the pooled httpx client instead of re-binding loggers per request.
+    """
+    return PlaceTool()
+
 
 class PlanTool:
     """
@@ -80,7 +194,9 @@ class PlanTool:
     def __init__(self, settings: Optional[Settings] = None):
         """Initialize plan tool."""
         self.settings = settings or get_settings()
-        self.place_tool = PlaceTool(settings)
+        self.place_tool = (
+            PlaceTool(settings) if settings is not None else _shared_place_tool()
+        )
         self.logger = get_logger("plan_tool")
 
     async def create_plan(
@@ -176,36 +292,149 @@ class PlanTool:
             places, num_locations, preferences
         )
 
+        return self._assemble_itinerary(
+            selected_places,
+            query=query,
+            city=city,
+            plan_type=plan_type,
+            default_duration=default_duration,
+            lat=lat,
+            lon=lon,
+            start_time=start_time,
+            num_people=num_people,
+            vibe=vibe,
+            budget=budget,
+            transport=transport,
+        )
+
+    def create_plan_from_places(
+        self,
+        places: List[PlaceResult],
+        query: str = "custom plan",
+        city: str = "Zaragoza",
+        start_time: Optional[str] = None,
+        plan_type: str = "casual",
+        default_duration: int = 60,
+        include_travel_time: bool = True,
+        lat: Optional[float] = None,
+        lon: Optional[float] = None,
+        num_people: Optional[int] = None,
+        vibe: Optional[str] = None,
+        budget: Optional[str] = None,
+        transport: Optional[str] = None,
+    ) -> Itinerary:
+        """
+        Assemble an itinerary from already-selected places.
+
+        In-process entry point for callers (e.g. generate_itinerary_tool)
+        that have their candidate list in hand: skips search_places and goes
+        straight to routing and step assembly, with no JSON round-trip.
+
+        Args:
+            places: Places to include, already chosen by the caller
+            query: Plan description used for the title and activities
+            city: City name
+            start_time: Optional start time (HH:MM format)
+            plan_type: Type of plan (casual, quick, full_day)
+            default_duration: Minutes to spend at each place
+            include_travel_time: Whether to estimate travel between stops
+            lat: Optional starting latitude
+            lon: Optional starting longitude
+            num_people: Number of people in group
+            vibe: Desired vibe (e.g., "romantic", "party", "chill")
+            budget: Budget level ("low", "medium", "high")
+            transport: Transport mode ("walking", "car", "public")
+
+        Returns:
+            Complete Itinerary object
+        """
+        if not places:
+            raise ValueError("No places provided for itinerary")
+
+        return self._assemble_itinerary(
+            places,
+            query=query,
+            city=city,
+            plan_type=plan_type,
+            default_duration=default_duration,
+            lat=lat,
+            lon=lon,
+            start_time=start_time,
+            num_people=num_people,
+            vibe=vibe,
+            budget=budget,
+            transport=transport,
+            include_travel_time=include_travel_time,
+        )
+
+    def _assemble_itinerary(
+        self,
+        selected_places: List[PlaceResult],
+        *,
+        query: str,
+        city: str,
+        plan_type: str,
+        default_duration: int,
+        lat: Optional[float] = None,
+        lon: Optional[float] = None,
+        start_time: Optional[str] = None,
+        num_people: Optional[int] = None,
+        vibe: Optional[str] = None,
+        budget: Optional[str] = None,
+        transport: Optional[str] = None,
+        include_travel_time: bool = True,
+    ) -> Itinerary:
+        """Route the selected places and build the final Itinerary."""
+        num_locations = len(selected_places)
+
         # Optimize route (simple nearest-neighbor for now)
-        optimized_route = self._optimize_route(selected_places, lat, lon)
+        perm, dist_matrix = self._optimize_route_order(selected_places, lat, lon)
+        optimized_route = [selected_places[i] for i in perm]
+
+        # Slice the route's edge distances straight out of the precomputed
+        # matrix: travel times and total distance come from the same pass
+        # instead of re-running Haversines per step. Edges to places
+        # without coordinates (inf) contribute nothing to the totals.
+        edges = dist_matrix[perm[:-1], perm[1:]] if len(perm) > 1 else np.zeros(0)
+        edges = np.where(np.isfinite(edges), edges, 0.0)
+        if include_travel_time:
+            travel_minutes = np.maximum(5, (edges / 5 * 60).astype(np.int64))
+        else:
+            travel_minutes = np.zeros(len(edges), dtype=np.int64)
+        total_distance = float(edges.sum())
 
-        # Build steps with time slots
+        # Build steps with time slots. Clock math is plain integer minutes
+        # (mod 1440 to wrap past midnight); only the HH:MM strings for the
+        # time slots are ever formatted, via f-strings instead of strftime.
         steps = []
-        current_time = self._parse_time(start_time) if start_time else None
+        query_lower = query.lower()
+        current_minutes = self._hhmm_to_minutes(start_time) if start_time else None
+        total_duration = 0
 
         for i, place in enumerate(optimized_route):
-            # Calculate travel time from previous location
-            travel_time = 0
-            if i > 0:
-                travel_time = self._estimate_travel_time(
-                    optimized_route[i - 1], place
-                )
+            # Travel time from previous location
+            travel_time = int(travel_minutes[i - 1]) if i > 0 else 0
+            total_duration += default_duration + travel_time
 
             # Create time slot if start_time was provided
             time_slot = None
-            if current_time:
-                start = current_time
-                current_time += timedelta(minutes=travel_time + default_duration)
-                time_slot = TimeSlot(
-                    start_time=start.strftime("%H:%M"),
-                    end_time=current_time.strftime("%H:%M"),
+            if current_minutes is not None:
+                start = current_minutes
+                current_minutes = (
+                    current_minutes + travel_time + default_duration
+                ) % 1440
+                time_slot = TimeSlot.model_construct(
+                    start_time=f"{start // 60:02d}:{start % 60:02d}",
+                    end_time=f"{current_minutes // 60:02d}:{current_minutes % 60:02d}",
                     duration_minutes=default_duration,
                 )
 
             # Generate activity suggestion
-            activity = self._suggest_activity(place, query, plan_type, vibe)
+            activity = self._suggest_activity(place, query_lower, plan_type, vibe)
 
-            step = PlanStep(
+            # All values here are built in-process with the right types, so
+            # model_construct skips pydantic's per-field revalidation
+            step = PlanStep.model_construct(
                 step_number=i + 1,
                 place=place,
                 time_slot=time_slot,
@@ -215,12 +444,6 @@ class PlanTool:
             )
             steps.append(step)
 
-        # Calculate totals
-        total_duration = sum(s.estimated_duration_minutes for s in steps) + sum(
-            s.travel_time_minutes or 0 for s in steps
-        )
-        total_distance = self._calculate_total_distance(optimized_route)
-
         # Generate recommendations
         recommendations = self._generate_recommendations(
             optimized_route, plan_type, city, num_people, vibe
@@ -266,36 +489,9 @@ class PlanTool:
 
     def _parse_duration(self, duration_str: str) -> int:
         """Convert duration string to minutes."""
-        duration_lower = duration_str.lower()
-
-        mapping = {
-            "quick": 30,
-            "rápido": 30,
-            "30 min": 30,
-            "1 hour": 60,
-            "una hora": 60,
-            "1h": 60,
-            "2 hours": 120,
-            "dos horas": 120,
-            "2h": 120,
-            "afternoon": 180,
-            "tarde": 180,
-            "evening": 240,
-            "noche": 240,
-            "full_day": 480,
-            "todo el día": 480,
-            "full day": 480,
-            "un día": 480,
-            "un dia": 480,
-            "1 día": 480,
-            "1 dia": 480,
-            "ida y vuelta": 480,
-            "day trip": 480,
-        }
-
-        for key, minutes in mapping.items():
-            if key in duration_lower:
-                return minutes
+        match = _DURATION_RE.search(duration_str)
+        if match:
+            return _DURATION_MAP[match.group(0).lower()]
 
         # Default: 2 hours if can't parse
         return 120
@@ -307,16 +503,18 @@ class PlanTool:
         preferences: Optional[List[str]] = None,
     ) -> List[PlaceResult]:
         """Select best places based on rating and preferences."""
-        # Filter by preferences if provided
+        # Filter by preferences if provided. Lowercase each string exactly
+        # once instead of re-allocating .lower() results per (place, pref)
+        # pair in the nested scan.
         if preferences:
+            pref_tokens = {pref.lower() for pref in preferences}
+            candidates = [
+                (p, (p.type or "").lower(), (p.name or "").lower()) for p in places
+            ]
             filtered = [
                 p
-                for p in places
-                if any(
-                    pref.lower() in (p.type or "").lower()
-                    or pref.lower() in (p.name or "").lower()
-                    for pref in preferences
-                )
+                for p, type_l, name_l in candidates
+                if any(tok in type_l or tok in name_l for tok in pref_tokens)
             ]
             if filtered:
                 places = filtered
@@ -328,56 +526,115 @@ class PlanTool:
 
         return sorted_places[:num_needed]
 
+    @staticmethod
+    def _coords_array(places: List[PlaceResult]) -> "np.ndarray":
+        """
+        Extract an (n, 2) lat/lon float array from a list of places.
+
+        Structure-of-arrays form for the routing math: built once per plan
+        and indexed by position, so the hot loops never touch PlaceResult
+        attributes again. Missing coordinates become NaN.
+        """
+        return np.array(
+            [
+                [p.latitude, p.longitude] if p.location else [np.nan, np.nan]
+                for p in places
+            ],
+            dtype=np.float64,
+        )
+
+    @staticmethod
+    def _distance_matrix(coords: "np.ndarray") -> "np.ndarray":
+        """
+        Build the full pairwise Haversine matrix (km) with NumPy broadcasting.
+
+        Places without coordinates get inf rows/columns so nearest-neighbor
+        selection naturally defers them to the end of the tour.
+        """
+        rad = np.radians(coords)
+        lats = rad[:, 0]
+        lons = rad[:, 1]
+        dlat = lats[:, None] - lats[None, :]
+        dlon = lons[:, None] - lons[None, :]
+        a = (
+            np.sin(dlat / 2) ** 2
+            + np.cos(lats)[:, None] * np.cos(lats)[None, :] * np.sin(dlon / 2) ** 2
+        )
+        dist = 2 * 6371 * np.arcsin(np.sqrt(a))
+        dist[np.isnan(dist)] = np.inf
+        return dist
+
     def _optimize_route(
         self,
         places: List[PlaceResult],
         start_lat: Optional[float] = None,
         start_lon: Optional[float] = None,
     ) -> List[PlaceResult]:
+        """Optimize route using nearest-neighbor algorithm."""
+        order, _ = self._optimize_route_order(places, start_lat, start_lon)
+        return [places[i] for i in order]
+
+    def _optimize_route_order(
+        self,
+        places: List[PlaceResult],
+        start_lat: Optional[float] = None,
+        start_lon: Optional[float] = None,
+    ) -> tuple["np.ndarray", "np.ndarray"]:
         """
-        Optimize route using nearest-neighbor algorithm.
+        Compute the nearest-neighbor visit order and the distance matrix.
+
+        All pairwise distances are computed once as a vectorized Haversine
+        matrix; the greedy loop then just masks visited rows and takes
+        argmin, instead of O(n²) Python-level _distance calls. The matrix
+        is returned alongside the permutation so create_plan can slice the
+        route's edge distances without recomputing any geodesics.
         More sophisticated routing could use Google Maps API.
+
+        Returns:
+            Tuple of (index permutation, pairwise distance matrix in km)
         """
-        if not places:
-            return []
+        n = len(places)
+        if n == 0:
+            return np.arange(0), np.zeros((0, 0))
 
-        if len(places) <= 2:
-            return places
+        coords = self._coords_array(places)
+        dist_matrix = self._distance_matrix(coords)
 
-        # Simple nearest-neighbor heuristic
-        route = []
-        remaining = places.copy()
+        if n <= 2:
+            return np.arange(n), dist_matrix
+
+        visited = np.zeros(n, dtype=bool)
+        order: List[int] = []
 
         # Start from user location if provided, otherwise first place
         if start_lat and start_lon:
-            current_lat, current_lon = start_lat, start_lon
-        else:
-            first = remaining.pop(0)
-            route.append(first)
-            current_lat = first.coordinates.get("lat") if first.coordinates else None
-            current_lon = first.coordinates.get("lon") if first.coordinates else None
-
-        # Find nearest neighbor iteratively
-        while remaining:
-            nearest = min(
-                remaining,
-                key=lambda p: self._distance(
-                    current_lat,
-                    current_lon,
-                    p.coordinates.get("lat") if p.coordinates else None,
-                    p.coordinates.get("lon") if p.coordinates else None,
-                ),
-            )
-            route.append(nearest)
-            remaining.remove(nearest)
-            current_lat = (
-                nearest.coordinates.get("lat") if nearest.coordinates else None
-            )
-            current_lon = (
-                nearest.coordinates.get("lon") if nearest.coordinates else None
+            rad = np.radians(coords)
+            start_lat_r, start_lon_r = np.radians(start_lat), np.radians(start_lon)
+            dlat = rad[:, 0] - start_lat_r
+            dlon = rad[:, 1] - start_lon_r
+            a = (
+                np.sin(dlat / 2) ** 2
+                + np.cos(start_lat_r) * np.cos(rad[:, 0]) * np.sin(dlon / 2) ** 2
             )
+            from_start = 2 * 6371 * np.arcsin(np.sqrt(a))
+            from_start[np.isnan(from_start)] = np.inf
+            current = int(np.argmin(from_start))
+        else:
+            current = 0
+
+        order.append(current)
+        visited[current] = True
 
-        return route
+        # Find nearest neighbor iteratively over the precomputed matrix,
+        # restricting argmin to unvisited indices so all-inf rows (places
+        # without coordinates) can't re-select a visited place
+        for _ in range(n - 1):
+            candidates = np.nonzero(~visited)[0]
+            current = int(candidates[np.argmin(dist_matrix[current][candidates])])
+            order.append(current)
+            visited[current] = True
+
+        return np.array(order), dist_matrix
 
     def _distance(
         self,
@@ -386,101 +643,82 @@ class PlanTool:
         lat2: Optional[float],
         lon2: Optional[float],
     ) -> float:
-        """Calculate Haversine distance between two points."""
-        if None in [lat1, lon1, lat2, lon2]:
+        """Calculate Haversine distance, inf when a coordinate is missing."""
+        if lat1 is None or lon1 is None or lat2 is None or lon2 is None:
             return float("inf")
-
-        from math import asin, cos, radians, sin, sqrt
-
-        R = 6371  # Earth radius in km
-
-        lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-
-        a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-        c = 2 * asin(sqrt(a))
-
-        return R * c
+        # Coincident points (loosely deduped places) skip the trig entirely
+        if lat1 == lat2 and lon1 == lon2:
+            return 0.0
+        return _haversine(lat1, lon1, lat2, lon2)
 
     def _estimate_travel_time(
         self, place1: PlaceResult, place2: PlaceResult
     ) -> int:
-        """Estimate travel time between two places (walking)."""
-        lat1 = place1.coordinates.get("lat") if place1.coordinates else None
-        lon1 = place1.coordinates.get("lon") if place1.coordinates else None
-        lat2 = place2.coordinates.get("lat") if place2.coordinates else None
-        lon2 = place2.coordinates.get("lon") if place2.coordinates else None
+        """Estimate walking travel time between two places.
 
-        distance_km = self._distance(lat1, lon1, lat2, lon2)
-
-        # Assume walking speed of 5 km/h
-        time_minutes = int((distance_km / 5) * 60)
+        create_plan no longer calls this per step (it slices edge distances
+        from the precomputed matrix); kept as a standalone helper.
+        """
+        distance_km = self._distance(
+            place1.latitude if place1.location else None,
+            place1.longitude if place1.location else None,
+            place2.latitude if place2.location else None,
+            place2.longitude if place2.location else None,
+        )
+        if distance_km == float("inf"):
+            distance_km = 0.0
 
-        # Minimum 5 minutes
-        return max(5, time_minutes)
+        # Assume walking speed of 5 km/h, minimum 5 minutes
+        return max(5, int((distance_km / 5) * 60))
 
     def _calculate_total_distance(self, places: List[PlaceResult]) -> float:
-        """Calculate total walking distance for route."""
-        total = 0.0
-        for i in range(len(places) - 1):
-            lat1 = places[i].coordinates.get("lat") if places[i].coordinates else None
-            lon1 = places[i].coordinates.get("lon") if places[i].coordinates else None
-            lat2 = (
-                places[i + 1].coordinates.get("lat")
-                if places[i + 1].coordinates
-                else None
-            )
-            lon2 = (
-                places[i + 1].coordinates.get("lon")
-                if places[i + 1].coordinates
-                else None
-            )
-            total += self._distance(lat1, lon1, lat2, lon2)
-        return total
-
-    def _parse_time(self, time_str: str) -> datetime:
-        """Parse time string to datetime."""
+        """Calculate total walking distance for a route (edge sum in km)."""
+        if len(places) < 2:
+            return 0.0
+        dist = self._distance_matrix(self._coords_array(places))
+        idx = np.arange(len(places))
+        edges = dist[idx[:-1], idx[1:]]
+        return float(np.where(np.isfinite(edges), edges, 0.0).sum())
+
+    def _hhmm_to_minutes(self, time_str: str) -> int:
+        """Parse an HH:MM string to minutes since midnight."""
         try:
             hour, minute = map(int, time_str.split(":"))
-            return datetime.now().replace(hour=hour, minute=minute, second=0)
+            return (hour * 60 + minute) % 1440
         except Exception:
-            return datetime.now()
+            now = datetime.now()
+            return now.hour * 60 + now.minute
 
     def _suggest_activity(
         self,
         place: PlaceResult,
-        query: str,
+        query_lower: str,
         plan_type: str,
         vibe: Optional[str] = None,
     ) -> str:
-        """Generate activity suggestion for a place."""
-        place_type = (place.type or "").lower()
+        """Generate activity suggestion for a place.
 
+        ``query_lower`` is the already-lowercased query, computed once per
+        plan in create_plan instead of per step here.
+        """
         # Vibe-based activities
         if vibe:
-            vibe_activities = {
-                "romantic": "Enjoy a romantic moment together",
-                "party": "Have fun and enjoy the atmosphere",
-                "adventure": "Explore and discover something new",
-                "chill": "Relax and unwind",
-            }
-            if vibe in vibe_activities:
-                return vibe_activities[vibe]
-
-        # Type-based activities
-        if "bar" in place_type or "bar" in query.lower():
-            return "Enjoy drinks and ambiance"
-        elif "restaurant" in place_type or "restaurant" in query.lower():
-            return "Have a meal and relax"
-        elif "museum" in place_type:
-            return "Explore exhibits"
-        elif "park" in place_type:
-            return "Take a leisurely walk"
-        elif "cafe" in place_type or "coffee" in place_type:
-            return "Grab a coffee and snack"
-        else:
-            return "Spend some time exploring"
+            activity = _VIBE_ACTIVITIES.get(vibe)
+            if activity:
+                return activity
+
+        # Type-based activities: hashed membership against the tokenized
+        # place type, then fall back to the query for bar/restaurant plans
+        tokens = place.type_tokens
+        for token, activity in _ACTIVITY_BY_TYPE.items():
+            if token in tokens:
+                return activity
+
+        if "bar" in query_lower:
+            return _ACTIVITY_BY_TYPE["bar"]
+        if "restaurant" in query_lower:
+            return _ACTIVITY_BY_TYPE["restaurant"]
+        return "Spend some time exploring"
 
     def _generate_title(self, query: str, city: str, num_locations: int) -> str:
         """Generate catchy title for itinerary."""
@@ -495,29 +733,28 @@ class PlanTool:
         vibe: Optional[str] = None,
     ) -> List[str]:
         """Generate general recommendations for the plan."""
-        recommendations = []
-
-        if plan_type == "quick":
-            recommendations.append("This is a quick tour - perfect for limited time")
-        elif plan_type == "full_day":
-            recommendations.append("Pack water and wear comfortable shoes")
-
-        recommendations.append("Check opening hours before visiting")
-        recommendations.append("Consider local transportation options")
-
-        avg_rating = sum(p.google_rating or 0 for p in places) / len(places)
-        if avg_rating >= 4.5:
-            recommendations.append("All locations are highly rated!")
-
-        if num_people and num_people > 4:
-            recommendations.append("Consider making reservations for large group")
-
-        if vibe == "romantic":
-            recommendations.append("Book in advance for a better experience")
-        elif vibe == "party":
-            recommendations.append("Check dress codes and peak hours")
-
-        return recommendations
+        ratings = np.fromiter(
+            (p.google_rating or 0.0 for p in places),
+            dtype=np.float32,
+            count=len(places),
+        )
+        avg_rating = float(ratings.mean())
+
+        # Single allocation: each candidate is a (condition, text) pair
+        pairs = (
+            (plan_type == "quick", "This is a quick tour - perfect for limited time"),
+            (plan_type == "full_day", "Pack water and wear comfortable shoes"),
+            (True, "Check opening hours before visiting"),
+            (True, "Consider local transportation options"),
+            (avg_rating >= 4.5, "All locations are highly rated!"),
+            (
+                bool(num_people and num_people > 4),
+                "Consider making reservations for large group",
+            ),
+            (vibe == "romantic", "Book in advance for a better experience"),
+            (vibe == "party", "Check dress codes and peak hours"),
+        )
+        return [text for condition, text in pairs if condition]
 
     def _personalize_itinerary(
         self,
@@ -527,16 +764,9 @@ class PlanTool:
         budget: Optional[str] = None,
     ) -> List[PlanStep]:
         """Add personalization based on group."""
-        personalization_notes = {
-            "romantic": "👫 Reserva con anticipación, estas son buenas opciones para parejas",
-            "party": "🎉 ¡A divertirse! Estos son los mejores lugares para un buen ambiente",
-            "adventure": "🚀 Prepárate para explorar lugares únicos y emocionantes",
-            "chill": "☕ Perfectos para relajarse y desconectar",
-        }
-
         for step in steps:
             if vibe:
-                step.personalization = personalization_notes.get(
+                step.personalization = _PERSONALIZATION_NOTES.get(
                     vibe, "Disfruta este lugar"
                 )
 
@@ -554,11 +784,4 @@ class PlanTool:
         self, steps: List[PlanStep], budget_level: Optional[str] = None
     ) -> str:
         """Estimate total cost."""
-        if budget_level == "high":
-            return "$$$"
-        elif budget_level == "medium":
-            return "$$"
-        elif budget_level == "low":
-            return "$"
-        else:
-            return "$$"
+        return _COST_MAP.get(budget_level, "$$")
@@ -4,15 +4,57 @@ Itinerary generation tool for creating multi-location plans.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
-from langchain_core.tools import tool
-from pydantic import BaseModel, Field
+from pydantic import ValidationError
 
+from src.tools.place_tool import PlaceResult
+from src.tools.plan_tool import PlanTool
 from src.utils.logger import get_logger
+from src.utils.tool_cache import tool
 
 logger = get_logger("itinerary_tool")
 
+# Declared PlaceResult field names, for trimming unknown keys before
+# validation (same trick as the place_tool response path)
+_PLACE_FIELDS = frozenset(PlaceResult.model_fields)
+
+
+@lru_cache(maxsize=1)
+def _plan_tool() -> PlanTool:
+    """Shared PlanTool instance (itself backed by the shared PlaceTool)."""
+    return PlanTool()
+
+
+def _coerce_place(data: Dict[str, Any]) -> Optional[PlaceResult]:
+    """Build a PlaceResult from a tool-supplied place dict.
+
+    Accepts both the local PlaceResult shape (location as [lon, lat]) and
+    the Google Places formatted shape (flat latitude/longitude keys),
+    filling the required fields with sensible defaults so partial dicts
+    from earlier tool calls still route. Returns None if the dict can't be
+    validated at all.
+    """
+    if "location" not in data and data.get("latitude") is not None:
+        lat, lon = data.get("latitude"), data.get("longitude")
+        if lon is not None:
+            data = {**data, "location": [lon, lat]}
+
+    payload: Dict[str, Any] = {
+        "id": str(data.get("id") or data.get("place_id") or data.get("name", "")),
+        "name": data.get("name", "Unknown"),
+        "type": data.get("type") or (data.get("types") or ["place"])[0],
+        "city": data.get("city") or "Zaragoza",
+    }
+    payload.update({k: data[k] for k in data.keys() & _PLACE_FIELDS})
+
+    try:
+        return PlaceResult.model_validate(payload)
+    except ValidationError as exc:
+        logger.warning("itinerary_place_skipped", error=str(exc))
+        return None
+
 
 @tool
 async def generate_itinerary_tool(
@@ -24,24 +66,24 @@ async def generate_itinerary_tool(
 ) -> Dict[str, Any]:
     """
     Generate an optimized itinerary from a list of places.
-    
+
     This tool takes selected places and creates a complete plan with:
     - Optimized route order
     - Time allocations for each place
     - Travel time between locations
     - Total duration estimate
     - Personalized recommendations
-    
+
     Args:
         places: List of place objects to include in the itinerary
         start_time: Suggested start time (HH:MM format)
         duration_per_place: Default minutes to spend at each place (default: 60)
         include_travel_time: Whether to calculate travel time (default: True)
         preferences: User preferences (vibe, budget, etc.)
-    
+
     Returns:
         Complete itinerary with timeline and recommendations
-    
+
     Example:
         generate_itinerary_tool(
             places=[place1, place2, place3],
@@ -51,23 +93,32 @@ async def generate_itinerary_tool(
         )
     """
     try:
-        logger.info(f"Generating itinerary for {len(places)} places")
-        
-        # TODO: Implement itinerary generation logic
-        # This should integrate with the existing plan_tool.py
-        
-        return {
-            "title": "Custom Itinerary",
-            "total_locations": len(places),
-            "steps": [],
-            "total_duration_minutes": duration_per_place * len(places),
-            "message": "Itinerary generation tool will use existing plan_tool implementation with enhancements.",
-        }
-        
+        logger.info("generating_itinerary", places_count=len(places))
+
+        place_objs = [p for p in map(_coerce_place, places) if p is not None]
+        if not place_objs:
+            return {
+                "error": True,
+                "message": "No valid places provided for the itinerary.",
+            }
+
+        prefs = preferences or {}
+        itinerary = _plan_tool().create_plan_from_places(
+            place_objs,
+            query=prefs.get("query", "custom plan"),
+            start_time=start_time,
+            default_duration=duration_per_place,
+            include_travel_time=include_travel_time,
+            num_people=prefs.get("num_people"),
+            vibe=prefs.get("vibe"),
+            budget=prefs.get("budget"),
+            transport=prefs.get("transport"),
+        )
+        return itinerary.model_dump()
+
     except Exception as e:
-        logger.error(f"Error generating itinerary: {str(e)}")
+        logger.error("itinerary_generation_error", error=str(e))
         return {
             "error": True,
             "message": f"Could not generate itinerary: {str(e)}",
         }
-
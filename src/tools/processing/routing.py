@@ -10,196 +10,350 @@ Use for:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import random
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
+import numpy as np
 from langchain_core.tools import tool
-from pydantic import BaseModel
 
-from src.config.settings import Settings, get_settings
+try:
+    # C-level parse of the raw bytes; a 25×25 matrix response is tens of
+    # KB and httpx's response.json() walks it in pure Python
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from src.config.settings import get_settings
 from src.utils.logger import get_logger
 
 logger = get_logger("routing_tool")
 
+# Sentinel for pairs the API couldn't route (element status != OK)
+_UNREACHABLE = np.iinfo(np.int32).max
 
-class RouteSegment(BaseModel):
-    """A segment of the route between two points."""
-    
-    from_location: Dict[str, float]
-    to_location: Dict[str, float]
-    distance_meters: int
-    duration_seconds: int
-    mode: str
+_MATRIX_BASE_URL = "https://maps.googleapis.com/maps/api/distancematrix/json"
 
+# Distance Matrix caps requests at 100 elements (and 25 per side); 10×10
+# tiles stay under both limits
+_TILE_SIZE = 10
 
-async def _calculate_distance_matrix(
+# Modes whose matrix is symmetric in practice (no one-way streets or
+# schedule effects), so the lower triangle can be mirrored locally
+# instead of fetched and billed
+_SYMMETRIC_MODES = frozenset({"walking", "bicycling"})
+
+# Shared AsyncClient so every Maps call (and every tile within a call)
+# reuses pooled keep-alive connections instead of paying TCP/TLS setup.
+# Created lazily on first use.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get or lazily create the shared HTTP client for Google Maps."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(20.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=20),
+        )
+    return _client
+
+
+async def close_routing_client() -> None:
+    """Close the shared HTTP client (called from the app shutdown hook)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# Tiling plus parallel modes can burst well past Google's per-second QPS
+# cap; capping in-flight requests client-side is much cheaper than eating
+# OVER_QUERY_LIMIT responses and server-side throttling. Created lazily
+# so the limit follows settings.
+_maps_sem: Optional[asyncio.Semaphore] = None
+
+_RETRY_BASE_SECONDS = 0.5
+_RETRY_JITTER_SECONDS = 0.25
+_MAX_RETRIES = 3
+
+
+@lru_cache(maxsize=1)
+def _api_key() -> Optional[str]:
+    """Google Maps API key, resolved once per process."""
+    return get_settings().google_maps_api_key
+
+
+def _get_maps_semaphore() -> asyncio.Semaphore:
+    """Get or lazily create the Google Maps concurrency limiter."""
+    global _maps_sem
+    if _maps_sem is None:
+        _maps_sem = asyncio.Semaphore(get_settings().google_maps_qps or 10)
+    return _maps_sem
+
+
+# LRU cache of fetched matrices keyed by (mode, rounded point tuple), so
+# re-planning the same set of places skips the network and the billed API
+# call. Coordinates are rounded to 5 decimals (~1 m) so jittered inputs
+# still hit; entries expire after a TTL well inside Google's 30-day
+# caching ToS.
+_matrix_cache: "OrderedDict[tuple, Tuple[float, np.ndarray, np.ndarray]]" = (
+    OrderedDict()
+)
+_MATRIX_CACHE_MAX = 256
+_MATRIX_TTL_SECONDS = 3600.0
+
+
+def _matrix_cache_key(points: List[Dict[str, float]], mode: str) -> tuple:
+    """Cache key for a point list. Order is preserved — matrix rows and
+    columns are positional, so a reordered set is a different matrix."""
+    return (mode, tuple((round(p["lat"], 5), round(p["lon"], 5)) for p in points))
+
+
+async def _request_matrix_tile(
+    client: httpx.AsyncClient,
     api_key: str,
     origins: List[Dict[str, float]],
     destinations: List[Dict[str, float]],
-    mode: str = "walking",
+    mode: str,
 ) -> Dict[str, Any]:
+    """Fetch one origins × destinations tile from the Distance Matrix API.
+
+    Requests pass through the shared semaphore so concurrent tiles/modes
+    stay under the QPS cap; OVER_QUERY_LIMIT still gets an exponential
+    backoff with jitter (asyncio.sleep, never blocking the loop) before
+    giving up.
     """
-    Calculate distance matrix using Google Maps Distance Matrix API.
-    
-    API Docs: https://developers.google.com/maps/documentation/distance-matrix
-    """
-    base_url = "https://maps.googleapis.com/maps/api/distancematrix/json"
-    
-    # Format coordinates
-    origins_str = "|".join([f"{o['lat']},{o['lon']}" for o in origins])
-    destinations_str = "|".join([f"{d['lat']},{d['lon']}" for d in destinations])
-    
     params = {
-        "origins": origins_str,
-        "destinations": destinations_str,
+        "origins": "|".join([f"{o['lat']},{o['lon']}" for o in origins]),
+        "destinations": "|".join([f"{d['lat']},{d['lon']}" for d in destinations]),
         "mode": mode,
         "key": api_key,
         "language": "es",
     }
-    
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        response = await client.get(base_url, params=params)
+    sem = _get_maps_semaphore()
+    for attempt in range(_MAX_RETRIES + 1):
+        async with sem:
+            response = await client.get(_MATRIX_BASE_URL, params=params)
         response.raise_for_status()
-        data = response.json()
-        
-        if data.get("status") != "OK":
-            raise Exception(f"Distance Matrix API error: {data.get('status')}")
-        
-        return data
+        data = _json_loads(response.content)
 
+        status = data.get("status")
+        if status == "OK":
+            return data
+        if status == "OVER_QUERY_LIMIT" and attempt < _MAX_RETRIES:
+            delay = _RETRY_BASE_SECONDS * 2**attempt + random.random() * _RETRY_JITTER_SECONDS
+            logger.warning("distance_matrix_over_query_limit", retry_in=round(delay, 2))
+            await asyncio.sleep(delay)
+            continue
+        raise Exception(f"Distance Matrix API error: {status}")
+    raise Exception("Distance Matrix API error: retries exhausted")
 
-def _optimize_route_order(
-    origin: Dict[str, float],
-    destinations: List[Dict[str, float]],
-    distance_matrix: Dict[str, Any],
-) -> List[int]:
+
+async def _calculate_distance_matrix(
+    api_key: str,
+    points: List[Dict[str, float]],
+    mode: str = "walking",
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Calculate the full points × points matrix via Google Distance Matrix.
+
+    Requesting the square matrix (instead of the old origin-offset layout)
+    gives route optimization and segment lookup one consistent indexing
+    scheme: row/column i is point i, with the origin at index 0.
+
+    Point sets beyond the API's 100-elements-per-request cap are split
+    into 10×10 tiles fetched concurrently with asyncio.gather and
+    stitched into the preallocated matrices, so wall time stays close to
+    one round-trip regardless of N.
+
+    API Docs: https://developers.google.com/maps/documentation/distance-matrix
+
+    Returns:
+        Tuple of (distance_meters, duration_seconds) int32 matrices; pairs
+        the API couldn't route hold the _UNREACHABLE sentinel.
+    """
+    key = _matrix_cache_key(points, mode)
+    cached = _matrix_cache.get(key)
+    if cached is not None:
+        stamp, distances, durations = cached
+        if time.monotonic() - stamp < _MATRIX_TTL_SECONDS:
+            _matrix_cache.move_to_end(key)
+            return distances, durations
+        del _matrix_cache[key]
+
+    n = len(points)
+    distances = np.full((n, n), _UNREACHABLE, dtype=np.int32)
+    durations = np.full((n, n), _UNREACHABLE, dtype=np.int32)
+
+    # For symmetric modes only the tiles touching the upper triangle are
+    # fetched (a tile with i0 >= j1 lies strictly below the diagonal);
+    # the missing half is mirrored after stitching, halving billed
+    # elements on large point sets
+    symmetric = mode in _SYMMETRIC_MODES
+    tiles = [
+        (i0, min(i0 + _TILE_SIZE, n), j0, min(j0 + _TILE_SIZE, n))
+        for i0 in range(0, n, _TILE_SIZE)
+        for j0 in range(0, n, _TILE_SIZE)
+        if not (symmetric and i0 >= min(j0 + _TILE_SIZE, n))
+    ]
+
+    client = _get_client()
+    results = await asyncio.gather(
+        *(
+            _request_matrix_tile(client, api_key, points[i0:i1], points[j0:j1], mode)
+            for i0, i1, j0, j1 in tiles
+        )
+    )
+
+    for (i0, _, j0, _), data in zip(tiles, results):
+        for i, row in enumerate(data.get("rows", [])):
+            for j, element in enumerate(row.get("elements", [])):
+                if element.get("status") == "OK":
+                    distances[i0 + i, j0 + j] = element["distance"]["value"]
+                    durations[i0 + i, j0 + j] = element["duration"]["value"]
+
+    if symmetric:
+        # Unfetched cells hold the (max int32) sentinel, so an
+        # elementwise minimum with the transpose fills each triangle
+        # from the other without touching fetched values
+        distances = np.minimum(distances, distances.T)
+        durations = np.minimum(durations, durations.T)
+
+    _matrix_cache[key] = (time.monotonic(), distances, durations)
+    while len(_matrix_cache) > _MATRIX_CACHE_MAX:
+        _matrix_cache.popitem(last=False)
+    return distances, durations
+
+
+def _optimize_route_order(distances: "np.ndarray") -> List[int]:
     """
     Simple greedy algorithm to optimize route order (nearest neighbor).
-    For production, consider using Google's waypoint optimization or more sophisticated algorithms.
+
+    Operates on the square distance matrix, starting at the origin
+    (index 0); returns 0-based destination indices (matrix index - 1).
+    For production, consider using Google's waypoint optimization or more
+    sophisticated algorithms.
     """
-    if len(destinations) <= 1:
-        return list(range(len(destinations)))
-    
-    # Greedy nearest neighbor
-    unvisited = set(range(len(destinations)))
+    n = distances.shape[0]  # origin + destinations
+    if n <= 2:
+        return list(range(n - 1))
+
+    # Each step is a single C-level argmin over the unvisited slice of the
+    # current row instead of a Python min() with per-candidate indexing;
+    # restricting to unvisited indices keeps all-sentinel rows from
+    # re-selecting a visited point
+    visited = np.zeros(n, dtype=bool)
+    visited[0] = True
     route = []
-    current_idx = -1  # Start from origin
-    
-    while unvisited:
-        min_distance = float('inf')
-        next_idx = None
-        
-        for dest_idx in unvisited:
-            # Get distance from current to destination
-            if current_idx == -1:
-                # From origin
-                distance = distance_matrix["rows"][0]["elements"][dest_idx].get("distance", {}).get("value", float('inf'))
-            else:
-                # From previous destination
-                distance = distance_matrix["rows"][current_idx + 1]["elements"][dest_idx].get("distance", {}).get("value", float('inf'))
-            
-            if distance < min_distance:
-                min_distance = distance
-                next_idx = dest_idx
-        
-        if next_idx is not None:
-            route.append(next_idx)
-            unvisited.remove(next_idx)
-            current_idx = next_idx
-    
+    current = 0  # Start from origin
+
+    for _ in range(n - 1):
+        candidates = np.nonzero(~visited)[0]
+        nxt = int(candidates[distances[current][candidates].argmin()])
+        route.append(nxt - 1)
+        visited[nxt] = True
+        current = nxt
+
     return route
 
 
-@tool
-async def calculate_route_tool(
-    origin: Dict[str, float],
-    destinations: List[Dict[str, float]],
-    mode: str = "walking",
-    optimize: bool = True,
-    language: str = "es",
-) -> Dict[str, Any]:
+def _two_opt(distances: "np.ndarray", route: List[int]) -> List[int]:
     """
-    Calculate optimal route between multiple locations using Google Maps.
-    
-    Use this tool to:
-    - Calculate distances and travel times between places
-    - Optimize the order of visits (nearest neighbor algorithm)
-    - Get total trip duration and distance
-    - Plan efficient itineraries
-    
+    Improve a nearest-neighbor tour with 2-opt segment reversals.
+
+    Repeatedly reverses sub-segments whose endpoints can be reconnected
+    more cheaply, until a full pass finds no improvement (capped at one
+    pass per point). The path is open — the tour doesn't return to the
+    origin — so reversing a suffix only re-prices its entry edge.
+    Nearest-neighbor alone can leave tours 25%+ over optimal; this pass
+    recovers most of that using the matrix already in memory.
+
     Args:
-        origin: Starting point {"lat": float, "lon": float}
-        destinations: List of destination points [{"lat": float, "lon": float}, ...]
-        mode: Transport mode ("walking", "driving", "transit", "bicycling")
-        optimize: Whether to optimize route order (default: True)
-        language: Language for directions ("es" or "en")
-    
+        distances: Square distance matrix (origin at index 0)
+        route: 0-based destination indices from _optimize_route_order
+
     Returns:
-        Optimized route with distances, travel times, and segments
-    
-    Examples:
-        - calculate_route_tool({"lat": 41.65, "lon": -0.89}, [{"lat": 41.66, "lon": -0.88}])
-        - calculate_route_tool(origin, destinations, mode="walking", optimize=True)
+        Improved route in the same 0-based destination indexing
     """
-    settings = get_settings()
-    
-    # Check if API key is configured
-    if not settings.google_maps_api_key:
-        logger.warning("GOOGLE_MAPS_API_KEY not configured")
-        return {
-            "error": True,
-            "message": "Google Maps API key not configured. Please set GOOGLE_MAPS_API_KEY in environment variables.",
-        }
-    
+    if len(route) < 3:
+        return route
+
+    # int64 view so sentinel arithmetic can't overflow int32
+    D = distances.astype(np.int64)
+    tour = [0] + [r + 1 for r in route]  # matrix indices, origin pinned
+    m = len(tour)
+
+    for _ in range(m):
+        improved = False
+        for i in range(1, m - 1):
+            for j in range(i + 1, m):
+                a, b, c = tour[i - 1], tour[i], tour[j]
+                removed = D[a, b]
+                added = D[a, c]
+                if j + 1 < m:
+                    d = tour[j + 1]
+                    removed += D[c, d]
+                    added += D[b, d]
+                if added < removed:
+                    tour[i : j + 1] = tour[i : j + 1][::-1]
+                    improved = True
+        if not improved:
+            break
+
+    return [t - 1 for t in tour[1:]]
+
+
+async def _route_for_mode(
+    api_key: str,
+    origin: Dict[str, float],
+    destinations: List[Dict[str, float]],
+    mode: str,
+    optimize: bool,
+    language: str,
+) -> Dict[str, Any]:
+    """Calculate the full route payload for a single transport mode."""
     try:
-        logger.info(f"Calculating route for {len(destinations)} destinations, mode: {mode}, optimize: {optimize}")
-        
-        if not destinations:
-            return {
-                "error": True,
-                "message": "No destinations provided.",
-            }
-        
-        # Calculate distance matrix
+        # Calculate the square distance/duration matrices (origin is row 0)
         all_points = [origin] + destinations
-        distance_matrix = await _calculate_distance_matrix(
-            api_key=settings.google_maps_api_key,
-            origins=all_points,
-            destinations=destinations,
+        distances, durations = await _calculate_distance_matrix(
+            api_key=api_key,
+            points=all_points,
             mode=mode,
         )
-        
+
         # Optimize route order if requested
         if optimize and len(destinations) > 1:
-            optimized_indices = _optimize_route_order(origin, destinations, distance_matrix)
+            optimized_indices = _two_opt(distances, _optimize_route_order(distances))
             optimized_destinations = [destinations[i] for i in optimized_indices]
         else:
             optimized_indices = list(range(len(destinations)))
             optimized_destinations = destinations
-        
-        # Build route segments
-        route_segments = []
+
+        # Build route segments by walking matrix indices (destination i is
+        # matrix index i + 1); the list is pre-sized so CPython never
+        # regrows it, then trimmed past any unreachable pairs
+        route_segments: List[Optional[Dict[str, Any]]] = [None] * len(optimized_indices)
+        reachable = 0
         total_distance_meters = 0
         total_duration_seconds = 0
-        
+
         current_point = origin
-        for i, dest_idx in enumerate(optimized_indices):
+        prev = 0  # origin
+        for dest_idx in optimized_indices:
             dest = destinations[dest_idx]
-            
-            # Get distance and duration from matrix
-            if i == 0:
-                # From origin to first destination
-                element = distance_matrix["rows"][0]["elements"][dest_idx]
-            else:
-                # From previous destination to this one
-                prev_idx = optimized_indices[i - 1]
-                element = distance_matrix["rows"][prev_idx + 1]["elements"][dest_idx]
-            
-            if element.get("status") == "OK":
-                distance = element["distance"]["value"]  # meters
-                duration = element["duration"]["value"]  # seconds
-                
-                segment = {
+            curr = dest_idx + 1
+            distance = int(distances[prev, curr])
+            duration = int(durations[prev, curr])
+
+            if distance != _UNREACHABLE:
+                route_segments[reachable] = {
                     "from": current_point,
                     "to": dest,
                     "distance_meters": distance,
@@ -208,13 +362,19 @@ async def calculate_route_tool(
                     "duration_minutes": round(duration / 60, 1),
                     "mode": mode,
                 }
-                
-                route_segments.append(segment)
+                reachable += 1
                 total_distance_meters += distance
                 total_duration_seconds += duration
                 current_point = dest
+                prev = curr
+        del route_segments[reachable:]
         
-        logger.info(f"Route calculated: {len(route_segments)} segments, {round(total_distance_meters/1000, 2)}km, {round(total_duration_seconds/60, 1)}min")
+        logger.info(
+            "route_calculated",
+            segments=len(route_segments),
+            total_km=round(total_distance_meters / 1000, 2),
+            total_minutes=round(total_duration_seconds / 60, 1),
+        )
         
         return {
             "origin": origin,
@@ -233,15 +393,92 @@ async def calculate_route_tool(
         }
         
     except httpx.HTTPError as e:
-        logger.error(f"HTTP error calculating route: {str(e)}")
+        logger.error("route_http_error", error=str(e))
         return {
             "error": True,
             "message": f"HTTP error calculating route: {str(e)}",
         }
     except Exception as e:
-        logger.error(f"Error calculating route: {str(e)}")
+        logger.error("route_error", error=str(e))
         return {
             "error": True,
             "message": f"Could not calculate route: {str(e)}",
         }
 
+
+@tool
+async def calculate_route_tool(
+    origin: Dict[str, float],
+    destinations: List[Dict[str, float]],
+    mode: str = "walking",
+    optimize: bool = True,
+    language: str = "es",
+    modes: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Calculate optimal route between multiple locations using Google Maps.
+
+    Use this tool to:
+    - Calculate distances and travel times between places
+    - Optimize the order of visits (nearest neighbor algorithm)
+    - Get total trip duration and distance
+    - Plan efficient itineraries
+    - Compare several transport modes in one call (pass modes=[...])
+
+    Args:
+        origin: Starting point {"lat": float, "lon": float}
+        destinations: List of destination points [{"lat": float, "lon": float}, ...]
+        mode: Transport mode ("walking", "driving", "transit", "bicycling")
+        optimize: Whether to optimize route order (default: True)
+        language: Language for directions ("es" or "en")
+        modes: Optional list of transport modes to compare; when given,
+            all modes are fetched in parallel and the result is keyed by mode
+
+    Returns:
+        Optimized route with distances, travel times, and segments; with
+        modes, {"by_mode": {mode: route, ...}}
+
+    Examples:
+        - calculate_route_tool({"lat": 41.65, "lon": -0.89}, [{"lat": 41.66, "lon": -0.88}])
+        - calculate_route_tool(origin, destinations, mode="walking", optimize=True)
+        - calculate_route_tool(origin, destinations, modes=["walking", "transit"])
+    """
+    api_key = _api_key()
+
+    # Check if API key is configured
+    if not api_key:
+        logger.warning("GOOGLE_MAPS_API_KEY not configured")
+        return {
+            "error": True,
+            "message": "Google Maps API key not configured. Please set GOOGLE_MAPS_API_KEY in environment variables.",
+        }
+
+    if not destinations:
+        return {
+            "error": True,
+            "message": "No destinations provided.",
+        }
+
+    if modes:
+        # Matrices for each mode are independent requests, so fetching
+        # them with gather costs the slowest mode instead of the sum
+        logger.info(
+            "calculating_route", destinations=len(destinations), modes=modes, optimize=optimize
+        )
+        results = await asyncio.gather(
+            *(
+                _route_for_mode(
+                    api_key, origin, destinations, m, optimize, language
+                )
+                for m in modes
+            )
+        )
+        return {"by_mode": dict(zip(modes, results))}
+
+    logger.info(
+        "calculating_route", destinations=len(destinations), mode=mode, optimize=optimize
+    )
+    return await _route_for_mode(
+        api_key, origin, destinations, mode, optimize, language
+    )
+
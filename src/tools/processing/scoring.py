@@ -13,8 +13,10 @@ Multi-factor scoring algorithm that considers:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from langchain_core.tools import tool
 from pydantic import BaseModel
 
@@ -35,129 +37,185 @@ class ScoringWeights(BaseModel):
     preferences: float = 0.05
 
 
-def _score_rating(place: Dict[str, Any], requirements: Dict[str, Any]) -> float:
-    """Score based on rating (0-1)."""
-    rating = place.get("rating", 0)
-    if rating == 0:
-        return 0.5  # Unknown rating, neutral score
-    
-    # Normalize to 0-1 (rating is typically 0-5)
-    return min(rating / 5.0, 1.0)
+# Factor order shared by the score matrix and the weights vector
+_WEIGHT_ORDER = ("rating", "price", "distance", "vibe", "availability", "popularity")
 
+# Default weights validated once at import; per-call construction only
+# happens when the caller overrides them
+_DEFAULT_WEIGHTS = ScoringWeights()
+_DEFAULT_WEIGHTS_DUMP = _DEFAULT_WEIGHTS.model_dump()
+_DEFAULT_WEIGHTS_VEC = np.array(
+    [getattr(_DEFAULT_WEIGHTS, name) for name in _WEIGHT_ORDER]
+)
 
-def _score_price(place: Dict[str, Any], requirements: Dict[str, Any]) -> float:
-    """Score based on price match with budget (0-1)."""
-    price_level = place.get("price_level")
-    budget = requirements.get("budget", "medium")
-    
-    # Map budget to price level (1-4)
-    budget_map = {
-        "low": 1,
-        "economic": 1,
-        "economico": 1,
-        "medium": 2,
-        "medio": 2,
-        "high": 3,
-        "alto": 3,
-        "luxury": 4,
-        "lujo": 4,
+# Map budget to price level (1-4)
+_BUDGET_MAP: Dict[str, int] = MappingProxyType({
+    "low": 1,
+    "economic": 1,
+    "economico": 1,
+    "medium": 2,
+    "medio": 2,
+    "high": 3,
+    "alto": 3,
+    "luxury": 4,
+    "lujo": 4,
+})
+
+
+def _places_to_soa(places: List[Dict[str, Any]]) -> Dict[str, "np.ndarray"]:
+    """Convert the place dicts into parallel arrays, one pass over the list.
+
+    Structure-of-arrays layout: the scoring factors then run as whole-array
+    NumPy expressions instead of seven Python function calls with dict
+    lookups per place. Missing numeric fields become NaN (or -1 for the
+    open_now tri-state) so the factor math can branch with np.where.
+    """
+    n = len(places)
+    ratings = np.zeros(n, dtype=np.float64)
+    price_levels = np.full(n, np.nan, dtype=np.float64)
+    lats = np.full(n, np.nan, dtype=np.float64)
+    lons = np.full(n, np.nan, dtype=np.float64)
+    review_counts = np.zeros(n, dtype=np.int64)
+    open_now = np.full(n, -1, dtype=np.int8)  # -1 unknown, 0 closed, 1 open
+
+    for i, place in enumerate(places):
+        ratings[i] = place.get("rating", 0) or 0
+        price_level = place.get("price_level")
+        if price_level is not None:
+            price_levels[i] = price_level
+        location = place.get("location") or {}
+        if location:
+            lats[i] = location.get("lat", 0)
+            lons[i] = location.get("lon", 0)
+        review_counts[i] = place.get("user_ratings_total", 0) or 0
+        is_open = place.get("open_now")
+        if is_open is not None:
+            open_now[i] = 1 if is_open else 0
+
+    return {
+        "ratings": ratings,
+        "price_levels": price_levels,
+        "lats": lats,
+        "lons": lons,
+        "review_counts": review_counts,
+        "open_now": open_now,
     }
-    
-    if price_level is None:
-        return 0.5  # Unknown price, neutral score
-    
-    target_price = budget_map.get(budget.lower(), 2)
-    difference = abs(price_level - target_price)
-    
-    # Score: 1.0 for exact match, decreases with difference
-    return max(0, 1.0 - (difference * 0.3))
 
 
-def _score_distance(place: Dict[str, Any], requirements: Dict[str, Any]) -> float:
-    """Score based on distance (0-1, closer is better)."""
+def _score_rating_arr(soa: Dict[str, "np.ndarray"]) -> "np.ndarray":
+    """Rating scores (0-1); unknown ratings get a neutral 0.5."""
+    ratings = soa["ratings"]
+    return np.where(ratings == 0, 0.5, np.minimum(ratings / 5.0, 1.0))
+
+
+def _score_price_arr(
+    soa: Dict[str, "np.ndarray"], requirements: Dict[str, Any]
+) -> "np.ndarray":
+    """Price-vs-budget scores (0-1); unknown price levels get 0.5."""
+    budget = requirements.get("budget", "medium")
+    target_price = _BUDGET_MAP.get(budget.casefold(), 2)
+    price_levels = soa["price_levels"]
+    scores = np.maximum(0.0, 1.0 - np.abs(price_levels - target_price) * 0.3)
+    return np.where(np.isnan(price_levels), 0.5, scores)
+
+
+def _haversine_km(
+    lats: "np.ndarray", lons: "np.ndarray", lat: float, lon: float
+) -> "np.ndarray":
+    """Haversine distances in km from arrays of points to a fixed point."""
+    lat_r = np.radians(lats)
+    lon_r = np.radians(lons)
+    user_lat_r = np.radians(lat)
+    dlat = lat_r - user_lat_r
+    dlon = lon_r - np.radians(lon)
+    a = (
+        np.sin(dlat / 2) ** 2
+        + np.cos(lat_r) * np.cos(user_lat_r) * np.sin(dlon / 2) ** 2
+    )
+    return 2 * 6371 * np.arcsin(np.sqrt(a))
+
+
+def _score_distance_arr(
+    soa: Dict[str, "np.ndarray"], requirements: Dict[str, Any]
+) -> "np.ndarray":
+    """Distance scores (0-1, closer is better); 0.5 without coordinates.
+
+    Proper great-circle distance — the old flat abs-diff approximation
+    under-scaled longitude away from 45° latitude.
+    """
     user_location = requirements.get("location")
+    lats = soa["lats"]
     if not user_location:
-        return 0.5  # No location, neutral score
-    
-    place_location = place.get("location", {})
-    if not place_location:
-        return 0.5
-    
-    # Simple distance calculation (not accurate, but good enough for ranking)
-    lat_diff = abs(place_location.get("lat", 0) - user_location.get("lat", 0))
-    lon_diff = abs(place_location.get("lon", 0) - user_location.get("lon", 0))
-    distance = (lat_diff ** 2 + lon_diff ** 2) ** 0.5
-    
+        return np.full(len(lats), 0.5)
+
+    distance_km = _haversine_km(
+        lats, soa["lons"], user_location.get("lat", 0), user_location.get("lon", 0)
+    )
+
     # Score: 1.0 for very close, decreases with distance
-    # Assume 0.01 degrees ≈ 1km
-    distance_km = distance * 111  # Rough conversion
-    return max(0, 1.0 - (distance_km * 0.1))
+    scores = np.maximum(0.0, 1.0 - distance_km * 0.1)
+    return np.where(np.isnan(lats), 0.5, scores)
+
+
+# Vibe matching keywords
+_VIBE_KEYWORDS: Dict[str, Tuple[str, ...]] = MappingProxyType({
+    "romantic": ("romantic", "romántico", "intimate", "íntimo", "cozy", "acogedor"),
+    "romantico": ("romantic", "romántico", "intimate", "íntimo", "cozy", "acogedor"),
+    "party": ("party", "fiesta", "club", "discoteca", "lively", "animado"),
+    "fiesta": ("party", "fiesta", "club", "discoteca", "lively", "animado"),
+    "quiet": ("quiet", "tranquilo", "peaceful", "calm", "sereno"),
+    "tranquilo": ("quiet", "tranquilo", "peaceful", "calm", "sereno"),
+    "family": ("family", "familiar", "kids", "niños", "children"),
+    "familiar": ("family", "familiar", "kids", "niños", "children"),
+    "trendy": ("trendy", "moderno", "hip", "modern", "contemporary"),
+    "moderno": ("trendy", "moderno", "hip", "modern", "contemporary"),
+})
 
 
 def _score_vibe(place: Dict[str, Any], requirements: Dict[str, Any]) -> float:
     """Score based on vibe/atmosphere match (0-1)."""
-    desired_vibe = requirements.get("vibe", "").lower()
+    desired_vibe = requirements.get("vibe", "").casefold()
     if not desired_vibe:
         return 0.5  # No vibe preference, neutral score
-    
-    # Check place types/categories
-    place_types = place.get("types", [])
-    place_name = place.get("name", "").lower()
-    place_description = place.get("description", "").lower()
-    
-    # Vibe matching keywords
-    vibe_keywords = {
-        "romantic": ["romantic", "romántico", "intimate", "íntimo", "cozy", "acogedor"],
-        "romantico": ["romantic", "romántico", "intimate", "íntimo", "cozy", "acogedor"],
-        "party": ["party", "fiesta", "club", "discoteca", "lively", "animado"],
-        "fiesta": ["party", "fiesta", "club", "discoteca", "lively", "animado"],
-        "quiet": ["quiet", "tranquilo", "peaceful", "calm", "sereno"],
-        "tranquilo": ["quiet", "tranquilo", "peaceful", "calm", "sereno"],
-        "family": ["family", "familiar", "kids", "niños", "children"],
-        "familiar": ["family", "familiar", "kids", "niños", "children"],
-        "trendy": ["trendy", "moderno", "hip", "modern", "contemporary"],
-        "moderno": ["trendy", "moderno", "hip", "modern", "contemporary"],
-    }
-    
-    keywords = vibe_keywords.get(desired_vibe, [desired_vibe])
-    
-    # Check for keyword matches
-    matches = 0
-    for keyword in keywords:
-        if keyword in place_name or keyword in place_description:
-            matches += 1
-        for ptype in place_types:
-            if keyword in ptype.lower():
-                matches += 1
-    
+
+    keywords = _VIBE_KEYWORDS.get(desired_vibe, (desired_vibe,))
+
+    # Each keyword is counted independently: overlapping keywords like
+    # "modern"/"moderno" both score when the longer one appears, matching
+    # the original nested substring scan. The C-level `in` scan over a
+    # handful of keywords is cheap; an alternation regex would consume
+    # each overlap once and change the counts.
+    haystack = (
+        f"{place.get('name', '').lower()}\n{place.get('description', '').lower()}"
+    )
+    matches = sum(1 for keyword in keywords if keyword in haystack)
+    for ptype in place.get("types", []):
+        ptype = ptype.lower()
+        matches += sum(1 for keyword in keywords if keyword in ptype)
+
     return min(matches * 0.3, 1.0)
 
 
-def _score_availability(place: Dict[str, Any], requirements: Dict[str, Any]) -> float:
-    """Score based on availability (0-1)."""
-    open_now = place.get("open_now")
-    
-    if open_now is None:
-        return 0.5  # Unknown, neutral score
-    
-    return 1.0 if open_now else 0.2  # Heavily penalize closed places
+def _score_availability_arr(soa: Dict[str, "np.ndarray"]) -> "np.ndarray":
+    """Availability scores: open 1.0, closed 0.2 (heavy penalty), unknown 0.5."""
+    open_now = soa["open_now"]
+    return np.where(open_now < 0, 0.5, np.where(open_now == 1, 1.0, 0.2))
 
 
-def _score_popularity(place: Dict[str, Any], requirements: Dict[str, Any]) -> float:
-    """Score based on popularity (review count) (0-1)."""
-    review_count = place.get("user_ratings_total", 0)
-    
-    # Score based on review count (logarithmic scale)
-    if review_count == 0:
-        return 0.3  # New place, lower score
-    elif review_count < 10:
-        return 0.5
-    elif review_count < 50:
-        return 0.7
-    elif review_count < 200:
-        return 0.85
-    else:
-        return 1.0
+def _score_popularity_arr(soa: Dict[str, "np.ndarray"]) -> "np.ndarray":
+    """Popularity scores from review counts, stepped on the same thresholds
+    as before (new places score lowest)."""
+    review_counts = soa["review_counts"]
+    return np.select(
+        [
+            review_counts == 0,
+            review_counts < 10,
+            review_counts < 50,
+            review_counts < 200,
+        ],
+        [0.3, 0.5, 0.7, 0.85],
+        default=1.0,
+    )
 
 
 @tool
@@ -165,6 +223,7 @@ async def rank_by_score_tool(
     places: List[Dict[str, Any]],
     requirements: Dict[str, Any],
     weights: Optional[Dict[str, float]] = None,
+    top_k: Optional[int] = None,
     language: str = "es",
 ) -> Dict[str, Any]:
     """
@@ -183,6 +242,7 @@ async def rank_by_score_tool(
         places: List of place objects to rank
         requirements: User requirements (vibe, budget, location, preferences, etc.)
         weights: Optional custom weights for scoring factors (overrides defaults)
+        top_k: Optional cap on results; only the K best places are returned
         language: Language for explanations ("es" or "en")
     
     Returns:
@@ -193,7 +253,7 @@ async def rank_by_score_tool(
         - rank_by_score_tool(places, {"location": {"lat": 41.65, "lon": -0.89}, "budget": "low"})
     """
     try:
-        logger.info(f"Ranking {len(places)} places with custom scoring")
+        logger.info("ranking_places", count=len(places))
         
         if not places:
             return {
@@ -202,58 +262,76 @@ async def rank_by_score_tool(
                 "message": "No places to rank.",
             }
         
-        # Initialize weights
+        # Initialize weights (the default instance is cached at module load)
         if weights:
             scoring_weights = ScoringWeights(**weights)
+            weights_vec = np.array(
+                [getattr(scoring_weights, name) for name in _WEIGHT_ORDER]
+            )
+            weights_dump = scoring_weights.model_dump()
         else:
-            scoring_weights = ScoringWeights()
+            weights_vec = _DEFAULT_WEIGHTS_VEC
+            weights_dump = _DEFAULT_WEIGHTS_DUMP
         
-        # Score each place
-        scored_places = []
-        for place in places:
-            scores = {
-                "rating": _score_rating(place, requirements),
-                "price": _score_price(place, requirements),
-                "distance": _score_distance(place, requirements),
-                "vibe": _score_vibe(place, requirements),
-                "availability": _score_availability(place, requirements),
-                "popularity": _score_popularity(place, requirements),
+        # Score all places at once over the SoA arrays; only the
+        # string-matching vibe factor still walks the place dicts
+        soa = _places_to_soa(places)
+        factor_scores = {
+            "rating": _score_rating_arr(soa),
+            "price": _score_price_arr(soa, requirements),
+            "distance": _score_distance_arr(soa, requirements),
+            "vibe": np.fromiter(
+                (_score_vibe(place, requirements) for place in places),
+                dtype=np.float64,
+                count=len(places),
+            ),
+            "availability": _score_availability_arr(soa),
+            "popularity": _score_popularity_arr(soa),
+        }
+
+        # Calculate weighted totals as one (N, 6) @ (6,) matmul, rounded
+        # to 2 decimals
+        factor_matrix = np.stack(
+            [factor_scores[name] for name in _WEIGHT_ORDER], axis=1
+        )
+        total_scores = np.round(factor_matrix @ weights_vec, 2)
+
+        # Rank by score (descending). With top_k, argpartition selects the
+        # K best in O(N) and only that slice gets sorted; result dicts are
+        # materialized for the selected indices only.
+        if top_k is not None and 0 < top_k < len(places):
+            idx = np.argpartition(-total_scores, top_k)[:top_k]
+            idx = idx[np.argsort(-total_scores[idx], kind="stable")]
+        else:
+            idx = np.argsort(-total_scores, kind="stable")
+
+        ranked_places = [
+            {
+                "place": places[i],
+                "score": float(total_scores[i]),
+                "score_breakdown": {
+                    name: round(float(values[i]), 2)
+                    for name, values in factor_scores.items()
+                },
             }
-            
-            # Calculate weighted total score
-            total_score = (
-                scores["rating"] * scoring_weights.rating +
-                scores["price"] * scoring_weights.price +
-                scores["distance"] * scoring_weights.distance +
-                scores["vibe"] * scoring_weights.vibe +
-                scores["availability"] * scoring_weights.availability +
-                scores["popularity"] * scoring_weights.popularity
-            )
-            
-            # Round to 2 decimals
-            total_score = round(total_score, 2)
-            
-            scored_places.append({
-                "place": place,
-                "score": total_score,
-                "score_breakdown": {k: round(v, 2) for k, v in scores.items()},
-            })
-        
-        # Sort by score (descending)
-        ranked_places = sorted(scored_places, key=lambda x: x["score"], reverse=True)
+            for i in map(int, idx)
+        ]
         
-        logger.info(f"Ranking complete. Top score: {ranked_places[0]['score'] if ranked_places else 0}")
+        logger.info(
+            "ranking_complete",
+            top_score=ranked_places[0]["score"] if ranked_places else 0,
+        )
         
         return {
             "ranked_places": ranked_places,
             "total_places": len(ranked_places),
-            "weights_used": scoring_weights.model_dump(),
+            "weights_used": weights_dump,
             "requirements": requirements,
             "language": language,
         }
         
     except Exception as e:
-        logger.error(f"Error ranking places: {str(e)}")
+        logger.error("ranking_error", error=str(e))
         return {
             "error": True,
             "message": f"Could not rank places: {str(e)}",
@@ -7,27 +7,129 @@ This is the PRIMARY search tool during beta phase.
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import hashlib
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 from langchain_core.tools import tool
 
+try:
+    # C-level parse; httpx's response.json() goes through pure-Python json
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from src.config.settings import get_settings
+from src.utils.cache_manager import get_cache_manager
 from src.utils.logger import get_logger
 
 logger = get_logger("google_places_tool")
 settings = get_settings()
 
+# Google's PRICE_LEVEL enum → numeric level, built once instead of per
+# normalized place
+_PRICE_LEVEL_MAP = {
+    "PRICE_LEVEL_FREE": 0,
+    "PRICE_LEVEL_INEXPENSIVE": 1,
+    "PRICE_LEVEL_MODERATE": 2,
+    "PRICE_LEVEL_EXPENSIVE": 3,
+    "PRICE_LEVEL_VERY_EXPENSIVE": 4,
+}
+
+# Shared AsyncClient so every Places request reuses pooled keep-alive
+# connections instead of paying a fresh TCP+TLS handshake per call.
+# Created lazily on first use.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or lazily create the shared HTTP client for Google Places."""
+    global _http_client
+    if _http_client is None:
+        # Tight per-phase budgets: a hung upstream otherwise pins a
+        # pooled connection for the whole flat timeout and can starve
+        # the pool during incidents
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(5.0, connect=2.0, pool=1.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _http_client
+
+
+async def close_google_places_client() -> None:
+    """Close the shared HTTP client (called from the app shutdown hook)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def warm_google_places_client() -> None:
+    """Prime the pooled connection to Google Places at startup.
+
+    The first search otherwise pays the full DNS + TCP + TLS handshake;
+    a throwaway HEAD during the app lifespan hides that from the first
+    user request. Failures are logged and swallowed — warming is best
+    effort only.
+    """
+    try:
+        await _get_http_client().head("https://places.googleapis.com/")
+        logger.info("google_places_client_warmed")
+    except Exception as exc:
+        logger.warning("google_places_warmup_failed", error=str(exc))
+
 
 class GooglePlacesClient:
     """Client for Google Places API (New) Text Search."""
-    
+
     BASE_URL = "https://places.googleapis.com/v1/places:searchText"
-    
+
+    # Exactly the fields _normalize_place consumes; the response payload
+    # (and the billing tier) scales with the mask, so nothing unused is
+    # requested. photos is by far the heaviest entry and callers that
+    # don't render images can drop it.
+    _FIELD_MASK = (
+        "places.id,"
+        "places.displayName,"
+        "places.formattedAddress,"
+        "places.location,"
+        "places.rating,"
+        "places.userRatingCount,"
+        "places.priceLevel,"
+        "places.types,"
+        "places.primaryType,"
+        "places.businessStatus,"
+        "places.googleMapsUri,"
+        "places.websiteUri,"
+        "places.internationalPhoneNumber"
+    )
+    _FIELD_MASK_WITH_PHOTOS = _FIELD_MASK + ",places.photos"
+
     def __init__(self):
         self.api_key = settings.google_places_api_key
         if not self.api_key:
             logger.warning("google_places_api_key not configured")
+        # Photo URL pieces with the key constant-folded once; per photo
+        # only the resource name is concatenated in between
+        self._photo_url_prefix = "https://places.googleapis.com/v1/"
+        self._photo_url_suffix = (
+            f"/media?maxHeightPx=800&maxWidthPx=800&key={self.api_key}"
+        )
+        # Request headers are constant per field-mask variant, so both
+        # dicts are frozen here instead of rebuilt per search
+        self._headers = {
+            "Content-Type": "application/json",
+            "X-Goog-Api-Key": self.api_key,
+            "X-Goog-FieldMask": self._FIELD_MASK,
+        }
+        self._headers_with_photos = dict(
+            self._headers, **{"X-Goog-FieldMask": self._FIELD_MASK_WITH_PHOTOS}
+        )
     
     async def search_places(
         self,
@@ -36,23 +138,27 @@ class GooglePlacesClient:
         radius_meters: int = 5000,
         max_results: int = 10,
         language: str = "es",
-    ) -> List[Dict[str, Any]]:
+        include_photos: bool = True,
+    ) -> Optional[List[Dict[str, Any]]]:
         """
         Search places using Google Places API (New).
-        
+
         Args:
             query: Natural language query (e.g., "restaurantes chinos")
             location: Optional dict with lat/lng for location bias
             radius_meters: Search radius in meters (default: 5000m = 5km)
             max_results: Maximum number of results (default: 10)
             language: Response language code (default: "es")
-        
+            include_photos: Whether to request the photos field (default: True)
+
         Returns:
-            List of place dictionaries with normalized fields
+            List of place dictionaries with normalized fields; an empty
+            list is a genuine zero-result search, None means the request
+            failed (so callers can avoid caching it)
         """
         if not self.api_key:
             logger.error("google_places_api_key not configured")
-            return []
+            return None
         
         try:
             # Build request body
@@ -74,151 +180,300 @@ class GooglePlacesClient:
                     }
                 }
             
-            headers = {
-                "Content-Type": "application/json",
-                "X-Goog-Api-Key": self.api_key,
-                "X-Goog-FieldMask": (
-                    "places.id,"
-                    "places.displayName,"
-                    "places.formattedAddress,"
-                    "places.location,"
-                    "places.rating,"
-                    "places.userRatingCount,"
-                    "places.priceLevel,"
-                    "places.types,"
-                    "places.primaryType,"
-                    "places.businessStatus,"
-                    "places.googleMapsUri,"
-                    "places.websiteUri,"
-                    "places.internationalPhoneNumber,"
-                    "places.photos"
+            headers = self._headers_with_photos if include_photos else self._headers
+
+
+            # One retry on timeout so the tighter budgets don't cost
+            # reliability on a transient hiccup
+            client = _get_http_client()
+            try:
+                response = await client.post(
+                    self.BASE_URL,
+                    json=request_body,
+                    headers=headers,
                 )
-            }
-            
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            except httpx.TimeoutException:
+                logger.warning("google_places_timeout_retry", query=query)
                 response = await client.post(
                     self.BASE_URL,
                     json=request_body,
                     headers=headers,
                 )
-                
-                if response.status_code != 200:
-                    logger.error(
-                        "google_places_api_error",
-                        status_code=response.status_code,
-                        error=response.text,
-                    )
-                    return []
-                
-                data = response.json()
-                places = data.get("places", [])
-                
-                # Normalize to consistent format
-                normalized_places = []
-                for place in places:
-                    normalized = self._normalize_place(place)
-                    normalized_places.append(normalized)
-                
-                logger.info(
-                    "google_places_search_success",
-                    query=query,
-                    results_count=len(normalized_places),
+
+            if response.status_code != 200:
+                logger.error(
+                    "google_places_api_error",
+                    status_code=response.status_code,
+                    error=response.text,
                 )
-                
-                return normalized_places
+                return None
+
+            data = _json_loads(response.content)
+            places = data.get("places", [])
+
+            # Normalize to consistent format
+            normalized_places = [self._normalize_place(place) for place in places]
+
+            logger.info(
+                "google_places_search_success",
+                query=query,
+                results_count=len(normalized_places),
+            )
+
+            return normalized_places
         
         except Exception as e:
             logger.error("google_places_search_failed", error=str(e), query=query)
-            return []
+            return None
     
     def _normalize_place(self, place: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize Google Places API response to consistent format."""
-        location = place.get("location", {})
-        display_name = place.get("displayName", {})
-        formatted_address = place.get("formattedAddress", "")
-        
-        # Process photos to get image URLs
-        images = []
-        photos = place.get("photos", [])
-        if photos and isinstance(photos, list):
-            for photo in photos[:3]:  # Get up to 3 photos
-                if isinstance(photo, dict) and photo.get("name"):
-                    # Construct photo URL using Places API (new) format
-                    photo_url = (
-                        f"https://places.googleapis.com/v1/{photo['name']}/media"
-                        f"?maxHeightPx=800&maxWidthPx=800&key={self.api_key}"
-                    )
-                    images.append(photo_url)
-        
+        # Bound method alias: this runs once per result, so the repeated
+        # attribute lookups are worth skipping
+        g = place.get
+        location = g("location", {})
+        display_name = g("displayName", {})
+        formatted_address = g("formattedAddress", "")
+
+        # Process photos to get image URLs (the field mask guarantees a
+        # list of {"name": ...} dicts when photos are requested); URL
+        # prefix/suffix were frozen at init with the key baked in
+        prefix, suffix = self._photo_url_prefix, self._photo_url_suffix
+        images = [
+            prefix + photo["name"] + suffix
+            for photo in g("photos", [])[:3]  # Get up to 3 photos
+            if photo.get("name")
+        ]
+
         # Extract neighborhood/district from address
         # Format: "C. de Ibiza, 23, Retiro, 28009 Madrid, España"
-        # District is usually the 3rd part (index 2)
+        # District is usually the 3rd part (index 2); only the first few
+        # parts matter, so the split is capped
         neighborhood = None
         if formatted_address:
-            parts = [p.strip() for p in formatted_address.split(",")]
+            parts = formatted_address.split(",", 3)
             if len(parts) >= 3:
                 # Try the district part (usually index 2)
-                neighborhood = parts[2]
+                neighborhood = parts[2].strip()
             elif len(parts) >= 2:
                 # Fallback to second part
-                neighborhood = parts[1]
+                neighborhood = parts[1].strip()
         
         return {
             # Core fields
-            "id": place.get("id"),
+            "id": g("id"),
             "name": display_name.get("text", "Unknown"),
             "address": formatted_address,
             "latitude": location.get("latitude"),
             "longitude": location.get("longitude"),
-            
+
             # Location details
             "neighborhood": neighborhood,
-            
+
             # Ratings
-            "rating": place.get("rating"),
-            "user_ratings_total": place.get("userRatingCount", 0),
-            
+            "rating": g("rating"),
+            "user_ratings_total": g("userRatingCount", 0),
+
             # Categories
-            "types": place.get("types", []),
-            "primary_type": place.get("primaryType"),
-            
+            "types": g("types", []),
+            "primary_type": g("primaryType"),
+
             # Pricing
-            "price_level": self._parse_price_level(place.get("priceLevel")),
-            
+            "price_level": self._parse_price_level(g("priceLevel")),
+
             # Status
-            "business_status": place.get("businessStatus", "OPERATIONAL"),
-            
+            "business_status": g("businessStatus", "OPERATIONAL"),
+
             # Links
-            "google_maps_uri": place.get("googleMapsUri"),
-            "website": place.get("websiteUri"),
-            "phone": place.get("internationalPhoneNumber"),
-            
+            "google_maps_uri": g("googleMapsUri"),
+            "website": g("websiteUri"),
+            "phone": g("internationalPhoneNumber"),
+
             # Images
             "images": images,
-            
+
             # Source
             "source": "google_places_api",
         }
-    
+
     def _parse_price_level(self, price_level: Optional[str]) -> Optional[int]:
         """Convert Google's PRICE_LEVEL enum to numeric."""
         if not price_level:
             return None
-        
-        price_map = {
-            "PRICE_LEVEL_FREE": 0,
-            "PRICE_LEVEL_INEXPENSIVE": 1,
-            "PRICE_LEVEL_MODERATE": 2,
-            "PRICE_LEVEL_EXPENSIVE": 3,
-            "PRICE_LEVEL_VERY_EXPENSIVE": 4,
-        }
-        
-        return price_map.get(price_level)
+        return _PRICE_LEVEL_MAP.get(price_level)
 
 
 # Singleton client
 _client = GooglePlacesClient()
 
+# Process-local L1 in front of Redis: a repeated query within the short
+# TTL skips both the Redis round-trip and its JSON (de)serialization.
+# Same OrderedDict-with-monotonic-stamps shape as the routing matrix
+# cache; the short TTL keeps it well inside the Redis entry's lifetime.
+_search_cache: "OrderedDict[tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_SEARCH_CACHE_MAX = 1024
+_SEARCH_TTL_SECONDS = 60.0
+
+# Redis TTLs by content volatility: the ranked search list goes stale as
+# rankings shuffle, but a place's profile (name, address, coordinates,
+# price level) barely moves, so profiles outlive the lists that found
+# them. The field mask requests no live data (open_now and the like), so
+# there is no short-lived tier to manage.
+TTL_POLICY = {
+    "search": 120,  # 2 min — ranked result lists
+    "place": 86400,  # 24 h — static place profiles
+    "negative": 120,  # 2 min — zero-result searches (a retry is a new paid miss)
+}
+
+
+def _local_cache_get(key: tuple) -> Optional[Dict[str, Any]]:
+    """Look up a search result in the in-process cache."""
+    cached = _search_cache.get(key)
+    if cached is None:
+        return None
+    stamp, result = cached
+    if time.monotonic() - stamp >= _SEARCH_TTL_SECONDS:
+        del _search_cache[key]
+        return None
+    _search_cache.move_to_end(key)
+    return result
+
+
+def _local_cache_set(key: tuple, result: Dict[str, Any]) -> None:
+    """Store a search result in the in-process cache, evicting LRU entries."""
+    _search_cache[key] = (time.monotonic(), result)
+    while len(_search_cache) > _SEARCH_CACHE_MAX:
+        _search_cache.popitem(last=False)
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _norm_query(query: str) -> str:
+    """Canonicalize a query for caching and search.
+
+    "Tapas Centro", "tapas  centro " and a full-width variant are the
+    same search; NFKC + casefold + whitespace collapse makes them share
+    one cache entry (text search itself is case-insensitive).
+    """
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", query).casefold().strip())
+
+
+def _redis_cache_key(local_key: tuple) -> str:
+    """Canonical Redis key for a search, hashed straight from the
+    argument tuple.
+
+    cache._generate_key json-serializes and sorts a kwargs dict per
+    call; the key parts here are already an ordered tuple of scalars,
+    so one pipe-joined f-string into the digest does the same job
+    (process-stable, unlike hash()) for a fraction of the work.
+    """
+    digest = hashlib.sha256(
+        "|".join(map(str, local_key)).encode("utf-8")
+    ).hexdigest()[:16]
+    return f"{settings.redis_key_prefix}:google_places:{digest}"
+
+
+# Single-flight: under a burst, many coroutines can miss the same key at
+# once and each fire a paid Places call. The first miss registers a
+# Future; concurrent misses for the same key await it instead of going
+# upstream themselves.
+_inflight: Dict[tuple, "asyncio.Future[Dict[str, Any]]"] = {}
+_inflight_lock = asyncio.Lock()
+
+
+async def _search_and_cache(
+    local_key: tuple,
+    query: str,
+    location: Optional[Dict[str, float]],
+    radius_meters: int,
+    max_results: int,
+    language: str,
+    include_photos: bool,
+) -> Dict[str, Any]:
+    """Resolve a cache miss through Redis and, failing that, the Places
+    API, populating both cache tiers on success. Always returns a result
+    payload — errors come back as the tool's error dict."""
+    try:
+        # L2: shared Redis cache
+        cache = await get_cache_manager()
+        cache_key = _redis_cache_key(local_key)
+        # Sliding expiration: a hit resets the short TTL, so queries that
+        # stay popular stay cached and only go back upstream once traffic
+        # on them pauses
+        cached = await cache.get(cache_key, touch_ttl=TTL_POLICY["search"])
+        if cached is not None:
+            _local_cache_set(local_key, cached)
+            return cached
+
+        # Search places
+        places = await _client.search_places(
+            query=query,
+            location=location,
+            radius_meters=radius_meters,
+            max_results=max_results,
+            language=language,
+            include_photos=include_photos,
+        )
+
+        if places is None:
+            # Failed request (API error, timeout, missing key): surface
+            # the empty payload but never cache it — the next attempt
+            # may succeed
+            return {
+                "success": False,
+                "places": [],
+                "count": 0,
+                "query": query,
+                "location": location,
+            }
+
+        result = {
+            "success": True,
+            "places": places,
+            "count": len(places),
+            "query": query,
+            "location": location,
+        }
+
+        if places:
+            _local_cache_set(local_key, result)
+            # The ranked list expires quickly; the individual profiles it
+            # surfaced are stable, so they are stored addressable by
+            # place id with the long TTL for other tools to reuse
+            await cache.set(cache_key, result, ttl=TTL_POLICY["search"])
+            await asyncio.gather(
+                *(
+                    cache.set(
+                        f"{settings.redis_key_prefix}:google_places:place:{place['id']}",
+                        place,
+                        ttl=TTL_POLICY["place"],
+                    )
+                    for place in places
+                    if place.get("id")
+                )
+            )
+        else:
+            # Negative cache: an agent retrying a query that just came
+            # back empty would burn another paid call for the same
+            # nothing. Transient failures are not cached — this branch
+            # only sees a clean zero-result response.
+            _local_cache_set(local_key, result)
+            await cache.set(cache_key, result, ttl=TTL_POLICY["negative"])
+            logger.debug("google_places_negative_cached", query=query)
+
+        return result
+
+    except Exception as e:
+        logger.error("google_places_tool_error", error=str(e), query=query)
+        return {
+            "success": False,
+            "places": [],
+            "count": 0,
+            "query": query,
+            "error": str(e),
+        }
+
 
 @tool
 async def google_places_tool(
@@ -228,6 +483,7 @@ async def google_places_tool(
     radius_meters: int = 5000,
     max_results: int = 10,
     language: str = "es",
+    include_photos: bool = True,
 ) -> dict:
     """
     🎯 PRIMARY SEARCH TOOL - Search for places using Google Places API.
@@ -242,7 +498,9 @@ async def google_places_tool(
         radius_meters: Search radius in meters (default: 5000m = 5km)
         max_results: Maximum number of results to return (default: 10, max: 20)
         language: Response language code (default: "es" for Spanish)
-    
+        include_photos: Whether to fetch photo URLs; disable when images
+            won't be shown to cut the largest part of the payload
+
     Returns:
         Dictionary with:
         - places: List of place dictionaries with details
@@ -267,35 +525,53 @@ async def google_places_tool(
             max_results=5
         )
     """
+    # Canonical query form so trivial variants share cache entries
+    query = _norm_query(query)
+
+    # Build location dict if coordinates provided
+    location = None
+    if latitude is not None and longitude is not None:
+        location = {"lat": latitude, "lng": longitude}
+
+    # L1: in-process cache for queries repeated within seconds
+    local_key = (
+        query, latitude, longitude, radius_meters, max_results, language, include_photos
+    )
+    cached = _local_cache_get(local_key)
+    if cached is not None:
+        return cached
+
+    # Coalesce concurrent misses for the same key onto one upstream fetch
+    async with _inflight_lock:
+        fut = _inflight.get(local_key)
+        leader = fut is None
+        if leader:
+            fut = asyncio.get_running_loop().create_future()
+            _inflight[local_key] = fut
+    if not leader:
+        return await fut
+
     try:
-        # Build location dict if coordinates provided
-        location = None
-        if latitude is not None and longitude is not None:
-            location = {"lat": latitude, "lng": longitude}
-        
-        # Search places
-        places = await _client.search_places(
-            query=query,
-            location=location,
-            radius_meters=radius_meters,
-            max_results=max_results,
-            language=language,
+        result = await _search_and_cache(
+            local_key, query, location, radius_meters, max_results, language, include_photos
         )
-        
-        return {
-            "success": True,
-            "places": places,
-            "count": len(places),
-            "query": query,
-            "location": location,
-        }
-    
-    except Exception as e:
-        logger.error("google_places_tool_error", error=str(e), query=query)
-        return {
-            "success": False,
-            "places": [],
-            "count": 0,
-            "query": query,
-            "error": str(e),
-        }
+        fut.set_result(result)
+        return result
+    finally:
+        if not fut.done():
+            # Only cancellation of the leader lands here
+            # (_search_and_cache returns error payloads instead of
+            # raising). Resolve the future with the uncached error dict —
+            # cancelling it would raise CancelledError inside followers
+            # that were never themselves cancelled.
+            fut.set_result(
+                {
+                    "success": False,
+                    "places": [],
+                    "count": 0,
+                    "query": query,
+                    "location": location,
+                }
+            )
+        async with _inflight_lock:
+            _inflight.pop(local_key, None)
@@ -4,6 +4,7 @@ Instagram hashtag tool for visual vibes and trends.
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
 from langchain_core.tools import tool
@@ -12,6 +13,16 @@ from src.utils.logger import get_logger
 
 logger = get_logger("instagram_tool")
 
+# Constant response template shared across calls until the tool is
+# implemented; per-call responses copy it and add the place name
+_STUB_RESULT = MappingProxyType(
+    {
+        "posts": [],
+        "vibe_analysis": {},
+        "message": "Instagram tool not yet implemented. Will use Instagram API.",
+    }
+)
+
 
 @tool
 async def instagram_hashtag_tool(
@@ -32,17 +43,6 @@ async def instagram_hashtag_tool(
     Returns:
         Instagram data with visual vibes and trends
     """
-    try:
-        logger.info(f"Instagram search: {place_name} in {location}")
-        
-        return {
-            "place_name": place_name,
-            "posts": [],
-            "vibe_analysis": {},
-            "message": "Instagram tool not yet implemented. Will use Instagram API.",
-        }
-        
-    except Exception as e:
-        logger.error(f"Error in Instagram search: {str(e)}")
-        return {"error": True, "message": f"Could not get Instagram data: {str(e)}"}
+    logger.info("instagram_search", place_name=place_name, location=location)
+    return dict(_STUB_RESULT, place_name=place_name)
 
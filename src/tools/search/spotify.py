@@ -4,6 +4,7 @@ Spotify API tool for venue music and vibe matching.
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
 from langchain_core.tools import tool
@@ -12,6 +13,16 @@ from src.utils.logger import get_logger
 
 logger = get_logger("spotify_tool")
 
+# Constant response template shared across calls until the tool is
+# implemented; per-call responses copy it and add the venue name
+_STUB_RESULT = MappingProxyType(
+    {
+        "playlists": [],
+        "music_vibe": {},
+        "message": "Spotify tool not yet implemented. Will use Spotify API.",
+    }
+)
+
 
 @tool
 async def spotify_api_tool(
@@ -28,17 +39,6 @@ async def spotify_api_tool(
     Returns:
         Music data and vibe analysis from Spotify
     """
-    try:
-        logger.info(f"Spotify search: {venue_name} in {location}")
-        
-        return {
-            "venue_name": venue_name,
-            "playlists": [],
-            "music_vibe": {},
-            "message": "Spotify tool not yet implemented. Will use Spotify API.",
-        }
-        
-    except Exception as e:
-        logger.error(f"Error in Spotify search: {str(e)}")
-        return {"error": True, "message": f"Could not get Spotify data: {str(e)}"}
+    logger.info("spotify_search", venue_name=venue_name, location=location)
+    return dict(_STUB_RESULT, venue_name=venue_name)
 
@@ -4,6 +4,7 @@ Trustpilot API tool for reviews and sentiment analysis.
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
 from langchain_core.tools import tool
@@ -12,6 +13,17 @@ from src.utils.logger import get_logger
 
 logger = get_logger("trustpilot_tool")
 
+# Constant response template shared across calls until the tool is
+# implemented; per-call responses copy it and add the place name
+_STUB_RESULT = MappingProxyType(
+    {
+        "reviews": [],
+        "average_rating": None,
+        "sentiment": None,
+        "message": "Trustpilot tool not yet implemented. Will use Trustpilot API.",
+    }
+)
+
 
 @tool
 async def trustpilot_api_tool(
@@ -30,18 +42,6 @@ async def trustpilot_api_tool(
     Returns:
         Reviews and sentiment analysis data
     """
-    try:
-        logger.info(f"Trustpilot search: {place_name} in {location}")
-        
-        return {
-            "place_name": place_name,
-            "reviews": [],
-            "average_rating": None,
-            "sentiment": None,
-            "message": "Trustpilot tool not yet implemented. Will use Trustpilot API.",
-        }
-        
-    except Exception as e:
-        logger.error(f"Error in Trustpilot search: {str(e)}")
-        return {"error": True, "message": f"Could not get Trustpilot data: {str(e)}"}
+    logger.info("trustpilot_search", place_name=place_name, location=location)
+    return dict(_STUB_RESULT, place_name=place_name)
 
@@ -7,6 +7,23 @@ from typing import Any, Callable, Optional
 import redis.asyncio as redis
 from redis.exceptions import RedisError
 
+try:
+    import orjson
+
+    # C-level encode/decode for cached values; payloads like place lists
+    # are float- and string-heavy, where orjson is several times faster
+    # than stdlib json
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=str)
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements
+
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, default=str).encode("utf-8")
+
+    _loads = json.loads
+
 from src.config.settings import Settings, get_settings
 from src.utils.logger import get_logger
 
@@ -72,12 +89,16 @@ class CacheManager:
         hash_value = hashlib.sha256(serialized.encode()).hexdigest()[:16]
         return f"{self.settings.redis_key_prefix}:{prefix}:{hash_value}"
 
-    async def get(self, key: str) -> Optional[Any]:
+    async def get(self, key: str, touch_ttl: Optional[int] = None) -> Optional[Any]:
         """
         Get value from cache.
 
         Args:
             key: Cache key
+            touch_ttl: When set, reset the key's TTL to this many seconds
+                on a hit (sliding expiration for hot keys). The GET and
+                EXPIRE share one pipelined round-trip; EXPIRE on a missing
+                key is a no-op.
 
         Returns:
             Cached value or None if not found/cache disabled
@@ -86,14 +107,20 @@ class CacheManager:
             return None
 
         try:
-            value = await self._redis.get(key)
+            if touch_ttl:
+                pipe = self._redis.pipeline(transaction=False)
+                pipe.get(key)
+                pipe.expire(key, touch_ttl)
+                value, _ = await pipe.execute()
+            else:
+                value = await self._redis.get(key)
             if value:
                 self.logger.debug("cache_hit", key=key)
-                return json.loads(value)
+                return _loads(value)
             else:
                 self.logger.debug("cache_miss", key=key)
                 return None
-        except (RedisError, json.JSONDecodeError) as exc:
+        except (RedisError, ValueError) as exc:
             self.logger.warning("cache_get_error", key=key, error=str(exc))
             return None
 
@@ -118,7 +145,7 @@ class CacheManager:
             return False
 
         try:
-            serialized = json.dumps(value, default=str)
+            serialized = _dumps(value)
             if ttl:
                 await self._redis.setex(key, ttl, serialized)
             else:
@@ -0,0 +1,46 @@
+"""
+Memoized wrapper around LangChain's ``@tool`` decorator.
+
+LangChain builds a Pydantic args_schema from each decorated function's
+signature and docstring at decoration time. That synthesis is pure given
+the function, so re-imports (uvicorn --reload, test suites spawning the
+app repeatedly) can reuse the previously built StructuredTool instead of
+re-running schema generation.
+"""
+
+from __future__ import annotations
+
+import inspect
+from typing import Any, Callable, Dict, Tuple
+
+from langchain_core.tools import tool as _langchain_tool
+
+# (module, qualname, signature, decorator kwargs) -> StructuredTool
+_TOOL_CACHE: Dict[Tuple, Any] = {}
+
+
+def _cached(fn: Callable, extra: Tuple) -> Any:
+    key = (fn.__module__, fn.__qualname__, str(inspect.signature(fn)), extra)
+    built = _TOOL_CACHE.get(key)
+    if built is None:
+        built = _langchain_tool(fn) if not extra else _langchain_tool(**dict(extra))(fn)
+        _TOOL_CACHE[key] = built
+    return built
+
+
+def tool(*args: Any, **kwargs: Any) -> Any:
+    """
+    Drop-in replacement for ``langchain_core.tools.tool`` with memoization.
+
+    Supports both the bare ``@tool`` form and ``@tool(args_schema=...)``
+    keyword form used in this codebase.
+    """
+    if args and callable(args[0]) and not kwargs:
+        return _cached(args[0], ())
+
+    extra = tuple(sorted(kwargs.items()))
+
+    def decorator(fn: Callable) -> Any:
+        return _cached(fn, extra)
+
+    return decorator
@@ -0,0 +1,68 @@
+import json
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import src.tools.place_tool as place_tool
+from src.tools.place_tool import PlaceSearchTool, normalize_query
+
+
+def make_response(payload):
+    request = httpx.Request("GET", "http://testserver/places/search")
+    return httpx.Response(200, content=json.dumps(payload).encode(), request=request)
+
+
+def make_tool(payload):
+    tool = PlaceSearchTool()
+    client = MagicMock()
+    client.get = AsyncMock(return_value=make_response(payload))
+    return tool, client
+
+
+@pytest.mark.asyncio
+async def test_search_places_raw_skips_null_and_junk_entries():
+    place = {"id": "1", "name": "Bar X", "type": "bar", "city": "Zaragoza"}
+    tool, client = make_tool({"data": [None, "junk", place]})
+
+    with patch.object(tool, "_get_client", return_value=client):
+        results = await tool.search_places_raw(query="null-entries", city="Zaragoza")
+
+    assert results == [place]
+
+
+@pytest.mark.asyncio
+async def test_search_places_raw_handles_null_data_field():
+    tool, client = make_tool({"data": None})
+
+    with patch.object(tool, "_get_client", return_value=client):
+        results = await tool.search_places_raw(query="null-data", city="Zaragoza")
+
+    assert results == []
+
+
+@pytest.mark.parametrize(
+    "query, expected_type",
+    [
+        # "barato" contains the substring "bar" but is not a bar query
+        ("sitio barato para comer", "restaurant"),
+        ("un bar con terraza", "bar"),
+        ("barrio del hostal", "lodging"),
+        ("hoteles cerca", "lodging"),
+        ("algo aleatorio", None),
+    ],
+)
+def test_automaton_and_regex_term_scans_agree(query, expected_type):
+    """Both keyword scanners must apply the same word-boundary semantics."""
+    assert place_tool._TERM_AUTOMATON is not None, "pyahocorasick not installed"
+
+    normalize_query.cache_clear()
+    automaton_result = normalize_query(query)
+
+    with patch.object(place_tool, "_TERM_AUTOMATON", None):
+        normalize_query.cache_clear()
+        regex_result = normalize_query(query)
+    normalize_query.cache_clear()
+
+    assert automaton_result == regex_result
+    assert automaton_result == (query, expected_type)